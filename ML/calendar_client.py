@@ -4,19 +4,161 @@ Handles authentication and CRUD operations with Google Calendar API
 """
 
 import os
+import copy
 import json
+import time
+import random
+import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from functools import cached_property, wraps
+from typing import Dict, List, Optional, Any, Sequence, Tuple
+from urllib.parse import quote
+from zoneinfo import ZoneInfo
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+import aiohttp
+import httplib2
+import numpy as np
+import orjson
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
 
 logger = logging.getLogger(__name__)
 
+# Google accepts at most 50 sub-requests per Calendar batch call
+BATCH_SIZE_LIMIT = 50
+
+CALENDAR_API_URL = 'https://www.googleapis.com/calendar/v3'
+
+# Socket timeout (seconds) for the persistent Calendar API connection
+HTTP_TIMEOUT = 30
+
+# Event listings are cached for EVENTS_CACHE_TTL seconds; entries younger than that but
+# within EVENTS_CACHE_REFRESH_MARGIN of expiring are served and refreshed in the background
+EVENTS_CACHE_SIZE = 64
+EVENTS_CACHE_TTL = 300
+EVENTS_CACHE_REFRESH_MARGIN = 30
+
+# Page size for events().list; listings longer than this are followed via pageToken
+EVENTS_PAGE_SIZE = 250
+
+# Calendar reports quota exhaustion as 403 rateLimitExceeded or 429; 5xx are transient
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RATE_LIMIT_REASONS = (b'rateLimitExceeded', b'userRateLimitExceeded')
+
+
+def _to_rfc3339(value: datetime) -> str:
+    """
+    Format a datetime as an RFC 3339 UTC timestamp accepted by the Calendar API
+
+    Args:
+        value (datetime): Timezone-aware datetime; naive values are treated as UTC
+
+    Returns:
+        str: Timestamp like '2025-06-12T10:00:00Z'
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat(timespec='seconds').replace('+00:00', 'Z')
+
+def _to_naive_in_zone(values: Sequence[datetime], zone: str) -> Sequence[datetime]:
+    """
+    Convert timezone-aware datetimes to naive wall-clock times in the given zone
+
+    Args:
+        values (Sequence[datetime]): Naive or aware datetimes, or a datetime64 array
+        zone (str): IANA timezone name the naive results are read in
+
+    Returns:
+        Sequence[datetime]: The values unchanged if none is aware, otherwise a list of naive datetimes
+    """
+    if isinstance(values, np.ndarray) or all(
+            not isinstance(value, datetime) or value.tzinfo is None for value in values):
+        return values
+    tz = ZoneInfo(zone)
+    return [
+        value.astimezone(tz).replace(tzinfo=None)
+        if isinstance(value, datetime) and value.tzinfo is not None else value
+        for value in values
+    ]
+
+def _is_retryable(error: HttpError) -> bool:
+    """Check whether an HttpError is a rate limit or a transient server failure"""
+    status = error.resp.status
+    if status in RETRY_STATUSES:
+        return True
+    # 403 is also used for permission errors, which retrying cannot fix
+    return status == 403 and any(reason in (error.content or b'') for reason in RATE_LIMIT_REASONS)
+
+
+def _retry_on_http_error(retries: int = 5, base: float = 0.5, cap: float = 30):
+    """
+    Retry a call on rate limit and transient HttpErrors with exponential backoff
+
+    Args:
+        retries (int): Retries after the first attempt
+        base (float): Delay before the first retry, in seconds
+        cap (float): Upper bound for a single delay, in seconds
+
+    Returns:
+        Callable: Decorator; the last HttpError is re-raised once retries run out
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(retries + 1):
+                try:
+                    return func(*args, **kwargs)
+                except HttpError as e:
+                    if attempt == retries or not _is_retryable(e):
+                        raise
+
+                    # Honour a server-directed delay, otherwise back off with jitter
+                    retry_after = e.resp.get('retry-after', '')
+                    if retry_after.isdigit():
+                        delay = min(cap, float(retry_after))
+                    else:
+                        delay = min(cap, base * 2 ** attempt) + random.uniform(0, 0.25)
+
+                    logger.warning(f"HTTP {e.resp.status} from Calendar API, retrying in {delay:.2f}s")
+                    time.sleep(delay)
+        return wrapper
+    return decorator
+
+
+class OrjsonModel(JsonModel):
+    """
+    googleapiclient JSON model that encodes request bodies and decodes
+    responses with orjson instead of the stdlib json module
+    """
+
+    def serialize(self, body_value):
+        if isinstance(body_value, dict) and 'data' not in body_value and self._data_wrapper:
+            body_value = {'data': body_value}
+        return orjson.dumps(body_value).decode()
+
+    def deserialize(self, content):
+        # A malformed body raises orjson.JSONDecodeError, a json.JSONDecodeError subclass,
+        # instead of being handed back as a raw string
+        body = orjson.loads(content)
+        if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+            body = body['data']
+        return body
+
 class GoogleCalendarClient:
     """
     Google Calendar API client with authentication and event management
@@ -28,12 +170,26 @@ class GoogleCalendarClient:
         self.credentials_file = credentials_file
         self.token_file = token_file
         self.scopes = scopes or ['https://www.googleapis.com/auth/calendar']
-        self.service = None
         self.creds = None
 
-        # Initialize the service
+        # (calendar_id, time_min, time_max, max_results) -> (fetched_at, events)
+        self._events_cache: OrderedDict = OrderedDict()
+        self._events_cache_lock = threading.Lock()
+        self._events_refreshing = set()
+
+        # Load credentials; the API service itself is built on first use
         self._authenticate()
 
+    @cached_property
+    def service(self):
+        """
+        Google Calendar API service, built on first access.
+        Uses a single authorized Http instance, so consecutive calls reuse
+        its keep-alive TLS connection instead of reconnecting.
+        """
+        http = AuthorizedHttp(self.creds, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+        return build('calendar', 'v3', http=http, model=OrjsonModel())
+
     def _authenticate(self):
         """
         Authenticate with Google Calendar API
@@ -46,7 +202,7 @@ class GoogleCalendarClient:
             # If there are no (valid) credentials available, let the user log in
             if not self.creds or not self.creds.valid:
                 if self.creds and self.creds.expired and self.creds.refresh_token:
-                    self.creds.refresh(Request())
+                    self._refresh_credentials()
                 else:
                     if not os.path.exists(self.credentials_file):
                         raise FileNotFoundError(
@@ -58,18 +214,57 @@ class GoogleCalendarClient:
                         self.credentials_file, self.scopes)
                     self.creds = flow.run_local_server(port=0)
 
-                # Save the credentials for the next run
-                with open(self.token_file, 'w') as token:
-                    token.write(self.creds.to_json())
+                    # Save the credentials for the next run
+                    self._save_token()
 
-            # Build the service
-            self.service = build('calendar', 'v3', credentials=self.creds)
             logger.info("Successfully authenticated with Google Calendar API")
 
         except Exception as e:
             logger.error(f"Error authenticating with Google Calendar: {e}")
             raise
 
+    def _refresh_credentials(self):
+        """
+        Refresh expired credentials while holding the token file lock,
+        so concurrent workers don't all refresh the same token
+        """
+        with self._token_lock():
+            # Another worker may have refreshed the token while we waited for the lock
+            if os.path.exists(self.token_file):
+                creds = Credentials.from_authorized_user_file(self.token_file, self.scopes)
+                if creds.valid:
+                    self.creds = creds
+                    return
+
+            self.creds.refresh(Request())
+            self._save_token()
+
+    @contextmanager
+    def _token_lock(self):
+        """Exclusive inter-process lock on the token file (no-op where fcntl is unavailable)"""
+        if fcntl is None:
+            yield
+            return
+
+        with open(f"{self.token_file}.lock", 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _save_token(self):
+        """Write the token atomically, so other processes never read a partial file"""
+        token_dir = os.path.dirname(os.path.abspath(self.token_file))
+        fd, tmp_path = tempfile.mkstemp(dir=token_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as token:
+                token.write(self.creds.to_json())
+            os.replace(tmp_path, self.token_file)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
     def create_event(self, event_data: Dict[str, Any], calendar_id: str = 'primary') -> Optional[str]:
         """
         Create a new calendar event
@@ -82,12 +277,13 @@ class GoogleCalendarClient:
             Optional[str]: Event ID if successful, None otherwise
         """
         try:
-            event = self.service.events().insert(
+            event = self._execute(self.service.events().insert(
                 calendarId=calendar_id,
                 body=event_data
-            ).execute()
+            ))
 
             event_id = event.get('id')
+            self.invalidate_events_cache(calendar_id)
             logger.info(f"Created event with ID: {event_id}")
             return event_id
 
@@ -101,15 +297,18 @@ class GoogleCalendarClient:
     def get_events(self, calendar_id: str = 'primary', 
                    time_min: Optional[datetime] = None,
                    time_max: Optional[datetime] = None,
-                   max_results: int = 10) -> List[Dict[str, Any]]:
+                   max_results: Optional[int] = 10,
+                   q: Optional[str] = None) -> List[Dict[str, Any]]:
         """
-        Get events from calendar
+        Get events from calendar.
+        Results are cached for a short time and refreshed in the background before they expire.
 
         Args:
             calendar_id (str): Calendar ID
             time_min (Optional[datetime]): Start time filter
             time_max (Optional[datetime]): End time filter
-            max_results (int): Maximum number of events to return
+            max_results (Optional[int]): Maximum number of events to return, all pages if None
+            q (Optional[str]): Free text search, filtered on the server
 
         Returns:
             List[Dict]: List of events
@@ -117,22 +316,36 @@ class GoogleCalendarClient:
         try:
             # Set default time range if not provided
             if time_min is None:
-                time_min = datetime.utcnow()
+                time_min = datetime.now(timezone.utc)
             if time_max is None:
                 time_max = time_min + timedelta(days=30)
 
-            events_result = self.service.events().list(
-                calendarId=calendar_id,
-                timeMin=time_min.isoformat() + 'Z',
-                timeMax=time_max.isoformat() + 'Z',
-                maxResults=max_results,
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
+            # Whole minutes keep the cache key stable between calls made "now"
+            key = (
+                calendar_id,
+                _to_rfc3339(time_min.replace(second=0, microsecond=0)),
+                _to_rfc3339(time_max.replace(second=0, microsecond=0)),
+                max_results,
+                q
+            )
+
+            with self._events_cache_lock:
+                cached = self._events_cache.get(key)
+                if cached is not None:
+                    self._events_cache.move_to_end(key)
 
-            events = events_result.get('items', [])
+            if cached is not None:
+                fetched_at, events = cached
+                age = time.monotonic() - fetched_at
+                if age < EVENTS_CACHE_TTL:
+                    if age >= EVENTS_CACHE_TTL - EVENTS_CACHE_REFRESH_MARGIN:
+                        self._refresh_events_in_background(key)
+                    # Callers may edit the events; the cached ones must stay intact
+                    return copy.deepcopy(events)
+
+            events = self._fetch_events(key)
             logger.info(f"Retrieved {len(events)} events")
-            return events
+            return copy.deepcopy(events)
 
         except HttpError as e:
             logger.error(f"HTTP error getting events: {e}")
@@ -141,6 +354,85 @@ class GoogleCalendarClient:
             logger.error(f"Error getting events: {e}")
             return []
 
+    def _fetch_events(self, key: Tuple[str, str, str, Optional[int], Optional[str]],
+                      http: Optional[httplib2.Http] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch events from the API, following pageToken, and store them in the cache
+
+        Args:
+            key (Tuple): Cache key holding the listing's query parameters
+            http (Optional[httplib2.Http]): Transport to send the requests over,
+                the service's shared connection if None
+
+        Returns:
+            List[Dict]: List of events
+        """
+        calendar_id, time_min, time_max, max_results, q = key
+        events = []
+        page_token = None
+        while True:
+            page_size = EVENTS_PAGE_SIZE
+            if max_results is not None:
+                page_size = min(page_size, max_results - len(events))
+
+            events_result = self._execute(self.service.events().list(
+                calendarId=calendar_id,
+                timeMin=time_min,
+                timeMax=time_max,
+                maxResults=page_size,
+                singleEvents=True,
+                orderBy='startTime',
+                q=q,
+                pageToken=page_token
+            ), http=http)
+
+            events.extend(events_result.get('items', []))
+            page_token = events_result.get('nextPageToken')
+            if not page_token or (max_results is not None and len(events) >= max_results):
+                break
+
+        with self._events_cache_lock:
+            self._events_cache[key] = (time.monotonic(), events)
+            self._events_cache.move_to_end(key)
+            while len(self._events_cache) > EVENTS_CACHE_SIZE:
+                self._events_cache.popitem(last=False)
+        return events
+
+    def _refresh_events_in_background(self, key: Tuple[str, str, str, Optional[int], Optional[str]]):
+        """Re-fetch a cached listing in a background thread (stale-while-revalidate)"""
+        with self._events_cache_lock:
+            if key in self._events_refreshing:
+                return
+            self._events_refreshing.add(key)
+
+        def refresh():
+            try:
+                # httplib2 connections are not thread-safe, so the refresh gets its own
+                # transport instead of sharing the service's with foreground calls
+                http = AuthorizedHttp(self.creds, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+                self._fetch_events(key, http=http)
+            except Exception as e:
+                logger.error(f"Error refreshing cached events: {e}")
+            finally:
+                with self._events_cache_lock:
+                    self._events_refreshing.discard(key)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def invalidate_events_cache(self, calendar_id: Optional[str] = None):
+        """
+        Drop cached event listings
+
+        Args:
+            calendar_id (Optional[str]): Calendar to invalidate, all calendars if None
+        """
+        with self._events_cache_lock:
+            if calendar_id is None:
+                self._events_cache.clear()
+            else:
+                for key in [key for key in self._events_cache if key[0] == calendar_id]:
+                    del self._events_cache[key]
+
     def update_event(self, event_id: str, event_data: Dict[str, Any], 
                      calendar_id: str = 'primary') -> bool:
         """
@@ -155,12 +447,13 @@ class GoogleCalendarClient:
             bool: True if successful, False otherwise
         """
         try:
-            updated_event = self.service.events().update(
+            updated_event = self._execute(self.service.events().update(
                 calendarId=calendar_id,
                 eventId=event_id,
                 body=event_data
-            ).execute()
+            ))
 
+            self.invalidate_events_cache(calendar_id)
             logger.info(f"Updated event with ID: {event_id}")
             return True
 
@@ -183,11 +476,12 @@ class GoogleCalendarClient:
             bool: True if successful, False otherwise
         """
         try:
-            self.service.events().delete(
+            self._execute(self.service.events().delete(
                 calendarId=calendar_id,
                 eventId=event_id
-            ).execute()
+            ))
 
+            self.invalidate_events_cache(calendar_id)
             logger.info(f"Deleted event with ID: {event_id}")
             return True
 
@@ -198,6 +492,124 @@ class GoogleCalendarClient:
             logger.error(f"Error deleting event: {e}")
             return False
 
+    @_retry_on_http_error()
+    def _execute(self, request: Any, http: Optional[httplib2.Http] = None) -> Dict[str, Any]:
+        """Execute a single API request, retrying rate limits and transient errors"""
+        return request.execute(http=http)
+
+    def _execute_batch(self, requests: List[Any]) -> List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]]:
+        """
+        Execute API requests as multipart batch calls
+
+        Args:
+            requests (List): Prepared googleapiclient requests
+
+        Returns:
+            List[Tuple]: (response, exception) pair for every request, in input order
+        """
+        # A request the batch never called back for counts as failed, like any other error
+        results: List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]] = [
+            (None, RuntimeError('no response')) for _ in requests
+        ]
+
+        def callback(request_id, response, exception):
+            results[int(request_id)] = (response, exception)
+
+        for offset in range(0, len(requests), BATCH_SIZE_LIMIT):
+            batch = self.service.new_batch_http_request(callback=callback)
+            for i, request in enumerate(requests[offset:offset + BATCH_SIZE_LIMIT], offset):
+                batch.add(request, request_id=str(i))
+            try:
+                batch.execute()
+            except Exception as e:
+                logger.error(f"Error executing batch request: {e}")
+                for i in range(offset, min(offset + BATCH_SIZE_LIMIT, len(requests))):
+                    results[i] = (None, e)
+
+        return results
+
+    def create_events_batch(self, events_data: List[Dict[str, Any]],
+                            calendar_id: str = 'primary') -> List[Optional[str]]:
+        """
+        Create several calendar events using batch requests
+
+        Args:
+            events_data (List[Dict]): Event data in Google Calendar format
+            calendar_id (str): Calendar ID to create events in
+
+        Returns:
+            List[Optional[str]]: Event ID for every event, None for failed ones
+        """
+        requests = [
+            self.service.events().insert(calendarId=calendar_id, body=event_data)
+            for event_data in events_data
+        ]
+
+        event_ids = []
+        for response, exception in self._execute_batch(requests):
+            if exception is not None:
+                logger.error(f"Error creating event in batch: {exception}")
+                event_ids.append(None)
+            else:
+                event_ids.append(response.get('id'))
+
+        self.invalidate_events_cache(calendar_id)
+        logger.info(f"Created {sum(1 for e in event_ids if e)} of {len(event_ids)} events in batch")
+        return event_ids
+
+    def update_events_batch(self, updates: List[Tuple[str, Dict[str, Any]]],
+                            calendar_id: str = 'primary') -> List[bool]:
+        """
+        Update several events using batch requests
+
+        Args:
+            updates (List[Tuple[str, Dict]]): (event ID, updated event data) pairs
+            calendar_id (str): Calendar ID
+
+        Returns:
+            List[bool]: Success flag for every update
+        """
+        requests = [
+            self.service.events().update(calendarId=calendar_id, eventId=event_id, body=event_data)
+            for event_id, event_data in updates
+        ]
+
+        statuses = []
+        for (event_id, _), (response, exception) in zip(updates, self._execute_batch(requests)):
+            if exception is not None:
+                logger.error(f"Error updating event {event_id} in batch: {exception}")
+            statuses.append(exception is None)
+
+        self.invalidate_events_cache(calendar_id)
+        logger.info(f"Updated {sum(statuses)} of {len(statuses)} events in batch")
+        return statuses
+
+    def delete_events_batch(self, event_ids: List[str], calendar_id: str = 'primary') -> List[bool]:
+        """
+        Delete several events using batch requests
+
+        Args:
+            event_ids (List[str]): Event IDs to delete
+            calendar_id (str): Calendar ID
+
+        Returns:
+            List[bool]: Success flag for every deletion
+        """
+        requests = [
+            self.service.events().delete(calendarId=calendar_id, eventId=event_id)
+            for event_id in event_ids
+        ]
+
+        statuses = []
+        for event_id, (response, exception) in zip(event_ids, self._execute_batch(requests)):
+            if exception is not None:
+                logger.error(f"Error deleting event {event_id} in batch: {exception}")
+            statuses.append(exception is None)
+
+        self.invalidate_events_cache(calendar_id)
+        logger.info(f"Deleted {sum(statuses)} of {len(statuses)} events in batch")
+        return statuses
+
     def find_events_by_summary(self, summary: str, calendar_id: str = 'primary',
                                time_min: Optional[datetime] = None,
                                time_max: Optional[datetime] = None) -> List[Dict[str, Any]]:
@@ -214,13 +626,15 @@ class GoogleCalendarClient:
             List[Dict]: Matching events
         """
         try:
-            events = self.get_events(calendar_id, time_min, time_max, max_results=100)
+            # q narrows the listing on the server; it also matches description and
+            # location, so keep the substring check on the summary
+            events = self.get_events(calendar_id, time_min, time_max, max_results=None, q=summary)
 
-            matching_events = []
-            for event in events:
-                event_summary = event.get('summary', '').lower()
-                if summary.lower() in event_summary:
-                    matching_events.append(event)
+            summary_lower = summary.lower()
+            matching_events = [
+                event for event in events
+                if summary_lower in event.get('summary', '').lower()
+            ]
 
             logger.info(f"Found {len(matching_events)} events matching '{summary}'")
             return matching_events
@@ -247,12 +661,12 @@ class GoogleCalendarClient:
 
         try:
             body = {
-                'timeMin': time_min.isoformat() + 'Z',
-                'timeMax': time_max.isoformat() + 'Z',
+                'timeMin': _to_rfc3339(time_min),
+                'timeMax': _to_rfc3339(time_max),
                 'items': [{'id': cal_id} for cal_id in calendar_ids]
             }
 
-            freebusy_result = self.service.freebusy().query(body=body).execute()
+            freebusy_result = self._execute(self.service.freebusy().query(body=body))
 
             logger.info("Retrieved free/busy information")
             return freebusy_result.get('calendars', {})
@@ -264,6 +678,309 @@ class GoogleCalendarClient:
             logger.error(f"Error getting free/busy: {e}")
             return {}
 
+class AsyncGoogleCalendarClient:
+    """
+    Asynchronous Google Calendar client for running independent requests concurrently.
+    Reuses credentials of a synchronous GoogleCalendarClient and talks to the REST API directly.
+    """
+
+    def __init__(self, client: GoogleCalendarClient, connection_limit: int = 20,
+                 keepalive_timeout: float = 75):
+        self.client = client
+        self.connection_limit = connection_limit
+        self.keepalive_timeout = keepalive_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._refresh_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> 'AsyncGoogleCalendarClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Close the underlying HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                json_serialize=lambda obj: orjson.dumps(obj).decode()
+            )
+        return self._session
+
+    async def _get_headers(self) -> Dict[str, str]:
+        creds = self.client.creds
+        if not creds.valid and creds.refresh_token:
+            async with self._refresh_lock:
+                if not creds.valid:
+                    # Token refresh is a blocking HTTP call, keep it off the event loop
+                    loop = asyncio.get_running_loop()
+                    await loop.run_in_executor(None, creds.refresh, Request())
+        return {'Authorization': f'Bearer {creds.token}'}
+
+    async def _request(self, method: str, path: str, params: Dict[str, Any] = None,
+                       body: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+        headers = await self._get_headers()
+        async with self._get_session().request(
+            method, f"{CALENDAR_API_URL}{path}", params=params, json=body, headers=headers
+        ) as response:
+            response.raise_for_status()
+            if response.status == 204:
+                return None
+            return orjson.loads(await response.read())
+
+    async def aget_events(self, calendar_id: str = 'primary',
+                          time_min: Optional[datetime] = None,
+                          time_max: Optional[datetime] = None,
+                          max_results: Optional[int] = 10,
+                          q: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get events from calendar
+
+        Args:
+            calendar_id (str): Calendar ID
+            time_min (Optional[datetime]): Start time filter
+            time_max (Optional[datetime]): End time filter
+            max_results (Optional[int]): Maximum number of events to return, all pages if None
+            q (Optional[str]): Free text search, filtered on the server
+
+        Returns:
+            List[Dict]: List of events
+        """
+        try:
+            if time_min is None:
+                time_min = datetime.now(timezone.utc)
+            if time_max is None:
+                time_max = time_min + timedelta(days=30)
+
+            params = {
+                'timeMin': _to_rfc3339(time_min),
+                'timeMax': _to_rfc3339(time_max),
+                'singleEvents': 'true',
+                'orderBy': 'startTime'
+            }
+            if q:
+                params['q'] = q
+
+            events = []
+            while True:
+                page_size = EVENTS_PAGE_SIZE
+                if max_results is not None:
+                    page_size = min(page_size, max_results - len(events))
+                params['maxResults'] = str(page_size)
+
+                events_result = await self._request(
+                    'GET', f"/calendars/{quote(calendar_id, safe='')}/events", params=params
+                )
+
+                events.extend(events_result.get('items', []))
+                page_token = events_result.get('nextPageToken')
+                if not page_token or (max_results is not None and len(events) >= max_results):
+                    break
+                params['pageToken'] = page_token
+
+            logger.info(f"Retrieved {len(events)} events")
+            return events
+
+        except aiohttp.ClientResponseError as e:
+            logger.error(f"HTTP error getting events: {e}")
+            return []
+        except Exception as e:
+            logger.error(f"Error getting events: {e}")
+            return []
+
+    async def aget_events_many(self, calendar_ids: List[str],
+                               time_min: Optional[datetime] = None,
+                               time_max: Optional[datetime] = None,
+                               max_results: Optional[int] = 10,
+                               q: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get events from several calendars concurrently
+
+        Args:
+            calendar_ids (List[str]): Calendar IDs
+            time_min (Optional[datetime]): Start time filter
+            time_max (Optional[datetime]): End time filter
+            max_results (Optional[int]): Maximum number of events per calendar, all pages if None
+            q (Optional[str]): Free text search, filtered on the server
+
+        Returns:
+            Dict[str, List[Dict]]: Events keyed by calendar ID
+        """
+        results = await asyncio.gather(*[
+            self.aget_events(calendar_id, time_min, time_max, max_results, q)
+            for calendar_id in calendar_ids
+        ])
+        return dict(zip(calendar_ids, results))
+
+    async def acreate_event(self, event_data: Dict[str, Any], calendar_id: str = 'primary') -> Optional[str]:
+        """
+        Create a new calendar event
+
+        Args:
+            event_data (Dict): Event data in Google Calendar format
+            calendar_id (str): Calendar ID to create event in
+
+        Returns:
+            Optional[str]: Event ID if successful, None otherwise
+        """
+        try:
+            event = await self._request(
+                'POST', f"/calendars/{quote(calendar_id, safe='')}/events", body=event_data
+            )
+
+            event_id = event.get('id')
+            self.client.invalidate_events_cache(calendar_id)
+            logger.info(f"Created event with ID: {event_id}")
+            return event_id
+
+        except aiohttp.ClientResponseError as e:
+            logger.error(f"HTTP error creating event: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Error creating event: {e}")
+            return None
+
+    async def aupdate_event(self, event_id: str, event_data: Dict[str, Any],
+                            calendar_id: str = 'primary') -> bool:
+        """
+        Update an existing event
+
+        Args:
+            event_id (str): Event ID to update
+            event_data (Dict): Updated event data
+            calendar_id (str): Calendar ID
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            await self._request(
+                'PUT',
+                f"/calendars/{quote(calendar_id, safe='')}/events/{quote(event_id, safe='')}",
+                body=event_data
+            )
+
+            self.client.invalidate_events_cache(calendar_id)
+            logger.info(f"Updated event with ID: {event_id}")
+            return True
+
+        except aiohttp.ClientResponseError as e:
+            logger.error(f"HTTP error updating event: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Error updating event: {e}")
+            return False
+
+    async def adelete_event(self, event_id: str, calendar_id: str = 'primary') -> bool:
+        """
+        Delete an event
+
+        Args:
+            event_id (str): Event ID to delete
+            calendar_id (str): Calendar ID
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            await self._request(
+                'DELETE',
+                f"/calendars/{quote(calendar_id, safe='')}/events/{quote(event_id, safe='')}"
+            )
+
+            self.client.invalidate_events_cache(calendar_id)
+            logger.info(f"Deleted event with ID: {event_id}")
+            return True
+
+        except aiohttp.ClientResponseError as e:
+            logger.error(f"HTTP error deleting event: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Error deleting event: {e}")
+            return False
+
+    async def afind_events_by_summary(self, summary: str, calendar_ids: List[str] = None,
+                                      time_min: Optional[datetime] = None,
+                                      time_max: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Find events by summary/title across several calendars concurrently
+
+        Args:
+            summary (str): Event summary to search for
+            calendar_ids (List[str]): Calendar IDs to search in
+            time_min (Optional[datetime]): Start time filter
+            time_max (Optional[datetime]): End time filter
+
+        Returns:
+            List[Dict]: Matching events
+        """
+        if calendar_ids is None:
+            calendar_ids = ['primary']
+
+        try:
+            events_by_calendar = await self.aget_events_many(
+                calendar_ids, time_min, time_max, max_results=None, q=summary
+            )
+
+            summary_lower = summary.lower()
+            matching_events = [
+                event
+                for events in events_by_calendar.values()
+                for event in events
+                if summary_lower in event.get('summary', '').lower()
+            ]
+
+            logger.info(f"Found {len(matching_events)} events matching '{summary}'")
+            return matching_events
+
+        except Exception as e:
+            logger.error(f"Error finding events by summary: {e}")
+            return []
+
+    async def aget_free_busy(self, time_min: datetime, time_max: datetime,
+                             calendar_ids: List[str] = None) -> Dict[str, List[Dict]]:
+        """
+        Get free/busy information for calendars
+
+        Args:
+            time_min (datetime): Start time
+            time_max (datetime): End time
+            calendar_ids (List[str]): List of calendar IDs to check
+
+        Returns:
+            Dict: Free/busy information
+        """
+        if calendar_ids is None:
+            calendar_ids = ['primary']
+
+        try:
+            body = {
+                'timeMin': _to_rfc3339(time_min),
+                'timeMax': _to_rfc3339(time_max),
+                'items': [{'id': cal_id} for cal_id in calendar_ids]
+            }
+
+            freebusy_result = await self._request('POST', '/freeBusy', body=body)
+
+            logger.info("Retrieved free/busy information")
+            return freebusy_result.get('calendars', {})
+
+        except aiohttp.ClientResponseError as e:
+            logger.error(f"HTTP error getting free/busy: {e}")
+            return {}
+        except Exception as e:
+            logger.error(f"Error getting free/busy: {e}")
+            return {}
+
 class EventBuilder:
     """
     Helper class to build Google Calendar event objects
@@ -320,6 +1037,54 @@ class EventBuilder:
 
         return event
 
+    @staticmethod
+    def build_events_bulk(summaries: Sequence[str], starts: Sequence[datetime], ends: Sequence[datetime],
+                          description: str = "", location: str = "", timezone: str = "Europe/Moscow",
+                          reminders: Dict = None) -> List[Dict[str, Any]]:
+        """
+        Build many Google Calendar event objects at once, e.g. for a timetable.
+        Start and end timestamps are formatted in one vectorized NumPy call; all events
+        share the same reminders dict, so do not mutate it on individual events.
+
+        Args:
+            summaries (Sequence[str]): Event titles
+            starts (Sequence[datetime]): Start datetimes or a datetime64 array; naive values
+                are local to `timezone`, aware ones are converted to it
+            ends (Sequence[datetime]): End datetimes or a datetime64 array, same as starts
+            description (str): Description for every event
+            location (str): Location for every event
+            timezone (str): Timezone
+            reminders (Dict): Reminder configuration
+
+        Returns:
+            List[Dict[str, Any]]: Google Calendar event objects
+        """
+        # datetime64 has no zone, so aware values become wall-clock times in `timezone` first
+        starts = _to_naive_in_zone(starts, timezone)
+        ends = _to_naive_in_zone(ends, timezone)
+        start_strings = np.datetime_as_string(np.asarray(starts, dtype='datetime64[s]'), unit='s')
+        end_strings = np.datetime_as_string(np.asarray(ends, dtype='datetime64[s]'), unit='s')
+
+        if not reminders:
+            reminders = {
+                'useDefault': False,
+                'overrides': [
+                    {'method': 'popup', 'minutes': 10},
+                ]
+            }
+
+        return [
+            {
+                'summary': summary,
+                'start': {'dateTime': start, 'timeZone': timezone},
+                'end': {'dateTime': end, 'timeZone': timezone},
+                'description': description,
+                'location': location,
+                'reminders': reminders,
+            }
+            for summary, start, end in zip(summaries, start_strings.tolist(), end_strings.tolist())
+        ]
+
     @staticmethod
     def build_all_day_event(summary: str, date_start: str, date_end: str = None,
                            description: str = "", location: str = "") -> Dict[str, Any]:
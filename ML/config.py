@@ -19,7 +19,10 @@ MODEL_CONFIG = {
     },
     'ner_model': {
         'model_path': NER_MODEL_PATH,
-        'language': 'ru'
+        'language': 'ru',
+        'batch_size': int(os.getenv('SCHEDY_SPACY_BATCH_SIZE', '64')),
+        # Opt-in: spaCy switches the whole process to the GPU, not just the NER model
+        'use_gpu': os.getenv('SCHEDY_SPACY_USE_GPU', '0') == '1'
     }
 }
 
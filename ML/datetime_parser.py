@@ -1,17 +1,150 @@
 """
 Date and Time Parsing Module
 Handles parsing of Russian date/time expressions for calendar events
+
+The module is fully annotated so it can be compiled ahead of time with mypyc:
+
+    mypyc datetime_parser.py
+
+The built extension (datetime_parser.*.so) sits next to this file and is imported
+in its place; without it the pure-Python module is used unchanged.
 """
 
 import re
-import pymorphy3
-import dateparser
+import calendar
 from datetime import datetime, date, timedelta, time
-from typing import Optional, Tuple, Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Tuple, Dict, Any, List, Callable, Mapping, cast
 import logging
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=1)
+def _get_date_data_parser():
+    """
+    Build the dateparser fallback on first use.
+    Importing dateparser loads all of its locale data, and the fallback is only
+    reached when none of the fast patterns match.
+    """
+    from dateparser.date import DateDataParser
+    return DateDataParser(languages=['ru'])
+
+
+@lru_cache(maxsize=1024)
+def _parse_date_fallback(text: str, today: date) -> Optional[date]:
+    """Parse a date with dateparser; keyed on the current day so relative dates stay correct"""
+    parsed = _get_date_data_parser().get_date_data(text).date_obj
+    return parsed.date() if parsed else None
+
+# Russian weekdays
+WEEKDAYS = MappingProxyType({
+    'понедельник': 0, 'пн': 0,
+    'вторник': 1, 'вт': 1,
+    'среда': 2, 'ср': 2, 'среду': 2,
+    'четверг': 3, 'чт': 3,
+    'пятница': 4, 'пт': 4, 'пятницу': 4,
+    'суббота': 5, 'сб': 5, 'субботу': 5,
+    'воскресение': 6, 'воскресенье': 6, 'вс': 6
+})
+
+# Russian months
+MONTHS = MappingProxyType({
+    'январь': 1, 'января': 1, 'янв': 1,
+    'февраль': 2, 'февраля': 2, 'фев': 2,
+    'март': 3, 'марта': 3, 'мар': 3,
+    'апрель': 4, 'апреля': 4, 'апр': 4,
+    'май': 5, 'мая': 5,
+    'июнь': 6, 'июня': 6, 'июн': 6,
+    'июль': 7, 'июля': 7, 'июл': 7,
+    'август': 8, 'августа': 8, 'авг': 8,
+    'сентябрь': 9, 'сентября': 9, 'сен': 9,
+    'октябрь': 10, 'октября': 10, 'окт': 10,
+    'ноябрь': 11, 'ноября': 11, 'ноя': 11,
+    'декабрь': 12, 'декабря': 12, 'дек': 12
+})
+
+# Days in each month: (month, is_leap_year) -> last day
+_MONTH_LENGTHS = MappingProxyType({
+    (month, leap): calendar.monthrange(2024 if leap else 2023, month)[1]
+    for month in range(1, 13) for leap in (False, True)
+})
+
+# Default times for vague time-of-day words, in priority order
+TIMES_OF_DAY = MappingProxyType({
+    'утром': time(9, 0), 'утра': time(9, 0),
+    'днем': time(14, 0), 'дня': time(14, 0),
+    'вечером': time(18, 0), 'вечера': time(18, 0),
+    'ночью': time(22, 0), 'ночи': time(22, 0)
+})
+
+# Recurrence phrases
+RECURRENCE_PHRASES = MappingProxyType({
+    'каждый день': 'RRULE:FREQ=DAILY', 'ежедневно': 'RRULE:FREQ=DAILY',
+    'каждую неделю': 'RRULE:FREQ=WEEKLY', 'еженедельно': 'RRULE:FREQ=WEEKLY',
+    'каждый месяц': 'RRULE:FREQ=MONTHLY', 'ежемесячно': 'RRULE:FREQ=MONTHLY',
+    'каждый год': 'RRULE:FREQ=YEARLY', 'ежегодно': 'RRULE:FREQ=YEARLY'
+})
+
+# 12-hour clock adjustment for "X утра / дня / вечера"
+_HOUR_ADJUSTMENTS = MappingProxyType({
+    'утра': lambda hour: 0 if hour == 12 else hour,
+    'дня': lambda hour: hour + 12 if hour < 12 else hour,
+    'вечера': lambda hour: hour + 12 if hour < 12 else hour
+})
+
+# Keyword table: keyword -> (category, value)
+_KEYWORDS: Mapping[str, Tuple[str, Any]] = MappingProxyType({
+    'завтра': ('relative', 1), 'сегодня': ('relative', 0),
+    'послезавтра': ('relative', 2), 'вчера': ('relative', -1),
+    **{name: ('weekday', num) for name, num in WEEKDAYS.items()},
+    **{phrase: ('recurrence', rule) for phrase, rule in RECURRENCE_PHRASES.items()}
+})
+
+# When a text holds several keywords of one category, the earliest in the table wins,
+# not the earliest in the text: завтра > сегодня > послезавтра > вчера, weekdays from
+# Monday, and daily > weekly > monthly > yearly recurrence
+_KEYWORD_PRIORITY: Dict[Tuple[str, Any], int] = {}
+for _rank, _entry in enumerate(_KEYWORDS.values()):
+    _KEYWORD_PRIORITY.setdefault(_entry, _rank)
+
+# Weekday forms as regex alternatives: full names take any inflection ("до четверга",
+# "по вторникам"), while the short abbreviations only match as whole words
+_WEEKDAY_FORMS = MappingProxyType({
+    0: r'понедельник\w*|пн',
+    1: r'вторник\w*|вт',
+    2: r'сред(?:[аеуы]|ам|ами|ах)|ср',
+    3: r'четверг\w*|чт',
+    4: r'пятниц\w*|пт',
+    5: r'суббот\w*|сб',
+    6: r'воскресен[ьи]\w*|вс'
+})
+
+# Every date, time and recurrence expression is one named alternative of a single
+# pattern, so a text is walked once and each match is dispatched on its group name.
+# Alternatives are ordered so that ranges win over the single times they contain.
+# No alternative nests quantifiers, so matching stays linear in the text length.
+# The pattern stays on `re`: RE2 has no lookahead and its \b is ASCII-only, which
+# would break the Cyrillic word boundaries below.
+_RE_EVENT = re.compile('|'.join([
+    r'(?P<range>с\s+(?P<range_start>\d{1,2}(?::\d{2})?)\s+до\s+(?P<range_end>\d{1,2}(?::\d{2})?))',
+    r'(?P<dash_range>(?P<dash_range_start>\d{1,2}(?::\d{2})?)\s*-\s*(?P<dash_range_end>\d{1,2}(?::\d{2})?))',
+    r'(?P<month_day>(?P<day>\d{1,2})\s+(?P<month>' + '|'.join(map(re.escape, MONTHS)) + r'))',
+    r'(?P<time_hm>(?P<hm_hour>\d{1,2}):(?P<hm_minute>\d{2}))',
+    r'(?P<time_hour>(?P<h_hour>\d{1,2})\s*ч(?:ас(?:а|ов)?)?(?![а-яё])\s*(?P<h_minute>\d{2})?)',
+    r'(?P<time_suffix>(?P<suffix_hour>\d{1,2})\s*(?P<suffix>утра|дня|вечера))',
+    r'(?P<weekday>\b(?:' + '|'.join(
+        f'(?P<weekday_{num}>{forms})' for num, forms in _WEEKDAY_FORMS.items()
+    ) + r')\b)',
+    r'(?P<keyword>\b(?:' + '|'.join(
+        r'\s+'.join(map(re.escape, keyword.split()))
+        for keyword, (category, _) in sorted(_KEYWORDS.items(), key=lambda item: len(item[0]), reverse=True)
+        if category != 'weekday'
+    ) + r')\b)',
+    r'(?P<time_of_day>\b(?:' + '|'.join(TIMES_OF_DAY) + r')\b)',
+]))
+
 class DateTimeParser:
     """
     Parse Russian date and time expressions
@@ -19,111 +152,189 @@ class DateTimeParser:
 
     def __init__(self, timezone: str = 'Europe/Moscow'):
         self.timezone = timezone
-        self.morph = pymorphy3.MorphAnalyzer()
-
-        # Define Russian weekdays
-        self.weekdays = {
-            'понедельник': 0, 'пн': 0,
-            'вторник': 1, 'вт': 1,
-            'среда': 2, 'ср': 2, 'среду': 2,
-            'четверг': 3, 'чт': 3,
-            'пятница': 4, 'пт': 4, 'пятницу': 4,
-            'суббота': 5, 'сб': 5, 'субботу': 5,
-            'воскресение': 6, 'воскресенье': 6, 'вс': 6
-        }
-
-        # Define Russian months
-        self.months = {
-            'январь': 1, 'января': 1, 'янв': 1,
-            'февраль': 2, 'февраля': 2, 'фев': 2,
-            'март': 3, 'марта': 3, 'мар': 3,
-            'апрель': 4, 'апреля': 4, 'апр': 4,
-            'май': 5, 'мая': 5,
-            'июнь': 6, 'июня': 6, 'июн': 6,
-            'июль': 7, 'июля': 7, 'июл': 7,
-            'август': 8, 'августа': 8, 'авг': 8,
-            'сентябрь': 9, 'сентября': 9, 'сен': 9,
-            'октябрь': 10, 'октября': 10, 'окт': 10,
-            'ноябрь': 11, 'ноября': 11, 'ноя': 11,
-            'декабрь': 12, 'декабря': 12, 'дек': 12
-        }
 
-        # Time patterns
-        self.time_patterns = [
-            r'(\d{1,2}):(\d{2})',  # HH:MM
-            r'(\d{1,2})\s*ч(?:ас(?:а|ов)?)?\s*(\d{2})?',  # X час(а/ов) MM
-            r'(\d{1,2})\s*утра',  # X утра
-            r'(\d{1,2})\s*дня',   # X дня
-            r'(\d{1,2})\s*вечера', # X вечера
-        ]
-
-    def parse_date(self, text: str) -> Optional[date]:
+        # Lookup tables and patterns are module-level and shared by all parsers
+        self.weekdays = WEEKDAYS
+        self.months = MONTHS
+        self.times_of_day = TIMES_OF_DAY
+        self.recurrence_phrases = RECURRENCE_PHRASES
+
+        # User phrases repeat a lot ("завтра в 10"), so memoize per instance.
+        # The scan depends only on the text; parsed events also depend on the current day.
+        # Both are keyed on the raw text, so a cache hit skips lowercasing as well.
+        # Held as attributes rather than rebinding the methods, which compiled classes forbid.
+        self._cached_scan: Callable[[str], Dict[str, List[Tuple[Any, str]]]] = \
+            lru_cache(maxsize=4096)(self._scan)
+        self._cached_parse_event: Callable[[str, date], Dict[str, Any]] = \
+            lru_cache(maxsize=2048)(self._parse_event)
+
+    def _scan(self, text: str) -> Dict[str, List[Tuple[Any, str]]]:
         """
-        Parse date from Russian text
+        Find all date, time and recurrence expressions in one pass over the text
 
         Args:
-            text (str): Input text containing date
+            text (str): Input text, lowercased here once for all parsers
 
         Returns:
-            Optional[date]: Parsed date or None
+            Dict[str, List[Tuple[Any, str]]]: (value, matched text) pairs by kind, in text order;
+                keyword kinds (relative, weekday, recurrence) in priority order instead
         """
-        if not text:
-            return None
-
-        text_lower = text.lower()
-        today = date.today()
-
+        hits: Dict[str, List[Tuple[Any, str]]] = {}
+        value: Any
+        for match in _RE_EVENT.finditer(text.lower()):
+            # Every alternative is a named group, so lastgroup is always set
+            kind = cast(str, match.lastgroup)
+            token = match.group(0)
+
+            if kind == 'keyword':
+                kind, value = _KEYWORDS[' '.join(token.split())]
+            elif kind == 'weekday':
+                value = next(num for num in _WEEKDAY_FORMS if match.group(f'weekday_{num}'))
+            elif kind in ('range', 'dash_range'):
+                value = (match.group(kind + '_start'), match.group(kind + '_end'))
+                # Clock times inside a range still count as standalone times
+                for bound in value:
+                    if ':' in bound:
+                        hits.setdefault('time_hm', []).append((tuple(map(int, bound.split(':'))), bound))
+            elif kind == 'month_day':
+                value = (int(match.group('day')), MONTHS[match.group('month')])
+            elif kind == 'time_hm':
+                value = (int(match.group('hm_hour')), int(match.group('hm_minute')))
+            elif kind == 'time_hour':
+                minute = match.group('h_minute')
+                value = (int(match.group('h_hour')), int(minute) if minute else 0)
+            elif kind == 'time_suffix':
+                value = _HOUR_ADJUSTMENTS[match.group('suffix')](int(match.group('suffix_hour')))
+            else:
+                value = token
+
+            hits.setdefault(kind, []).append((value, token))
+
+        # Put the winning keyword first; the sort is stable, so ties keep text order
+        for kind in ('relative', 'weekday', 'recurrence'):
+            if kind in hits:
+                hits[kind].sort(key=lambda hit: _KEYWORD_PRIORITY[kind, hit[0]])
+        return hits
+
+    def _resolve_date(self, hits: Dict[str, List[Tuple[Any, str]]], text: str,
+                      today: date) -> Optional[date]:
         try:
             # Handle relative dates
-            if re.search(r'\bзавтра\b', text_lower):
-                return today + timedelta(days=1)
-
-            if re.search(r'\bсегодня\b', text_lower):
-                return today
-
-            if re.search(r'\bпослезавтра\b', text_lower):
-                return today + timedelta(days=2)
-
-            if re.search(r'\bвчера\b', text_lower):
-                return today - timedelta(days=1)
+            if 'relative' in hits:
+                return today + timedelta(days=hits['relative'][0][0])
 
             # Handle weekdays
-            for weekday_name, weekday_num in self.weekdays.items():
-                if weekday_name in text_lower:
-                    days_ahead = weekday_num - today.weekday()
-                    if days_ahead <= 0:  # Target day already happened this week
-                        days_ahead += 7
-                    return today + timedelta(days=days_ahead)
+            if 'weekday' in hits:
+                # Nearest future occurrence; today's weekday means next week
+                days_ahead = (hits['weekday'][0][0] - today.weekday()) % 7 or 7
+                return today + timedelta(days=days_ahead)
 
             # Handle specific dates with months
-            # Pattern: DD месяц or месяц DD
-            month_pattern = r'(\d{1,2})\s+(' + '|'.join(self.months.keys()) + r')'
-            match = re.search(month_pattern, text_lower)
-            if match:
-                day = int(match.group(1))
-                month_name = match.group(2)
-                month = self.months[month_name]
+            # Pattern: DD месяц
+            if 'month_day' in hits:
+                day, month = hits['month_day'][0][0]
                 year = today.year
 
                 # If the date has passed this year, assume next year
-                try:
+                if 1 <= day <= _MONTH_LENGTHS[month, calendar.isleap(year)]:
                     parsed_date = date(year, month, day)
-                    if parsed_date < today:
-                        parsed_date = date(year + 1, month, day)
-                    return parsed_date
-                except ValueError:
-                    pass
+                    if parsed_date >= today:
+                        return parsed_date
+                    if day <= _MONTH_LENGTHS[month, calendar.isleap(year + 1)]:
+                        return date(year + 1, month, day)
 
             # Try dateparser as fallback
-            parsed = dateparser.parse(text, languages=['ru'])
-            if parsed:
-                return parsed.date()
+            return _parse_date_fallback(text, today)
 
         except Exception as e:
             logger.error(f"Error parsing date from '{text}': {e}")
 
         return None
 
+    def _resolve_time(self, hits: Dict[str, List[Tuple[Any, str]]]) -> Tuple[Optional[time], Optional[str]]:
+        if 'time_hm' in hits:  # HH:MM format
+            (hour, minute), token = hits['time_hm'][0]
+            return time(hour, minute), token
+
+        if 'time_hour' in hits:  # X час MM
+            (hour, minute), token = hits['time_hour'][0]
+            return time(hour, minute), token
+
+        if 'time_suffix' in hits:  # X утра / дня / вечера, already on the 24-hour clock
+            hour, token = hits['time_suffix'][0]
+            return time(hour, 0), token
+
+        # Handle special time expressions
+        if 'time_of_day' in hits:
+            words = {word for word, _ in hits['time_of_day']}
+            for word, default_time in TIMES_OF_DAY.items():
+                if word in words:
+                    return default_time, word
+
+        return None, None
+
+    def _resolve_time_range(self, hits: Dict[str, List[Tuple[Any, str]]],
+                            date_context: date) -> Tuple[Optional[datetime], Optional[datetime], Optional[str]]:
+        # Look for time range patterns like "с 10:00 до 12:00" or "10:00-12:00"
+        for kind in ('range', 'dash_range'):
+            if kind not in hits:
+                continue
+
+            (start_str, end_str), token = hits[kind][0]
+
+            # Parse start time
+            start_time = self._parse_clock(start_str)
+            if start_time:
+                start_dt = datetime.combine(date_context, start_time)
+            else:
+                continue
+
+            # Parse end time
+            end_time = self._parse_clock(end_str)
+            if end_time:
+                end_dt = datetime.combine(date_context, end_time)
+
+                # If end time is before start time, assume next day
+                if end_dt <= start_dt:
+                    end_dt = datetime.combine(date_context + timedelta(days=1), end_time)
+            else:
+                # Default 1 hour duration
+                end_dt = start_dt + timedelta(hours=1)
+
+            return start_dt, end_dt, token
+
+        # If no range found, parse single time and add default duration
+        single_time, time_token = self._resolve_time(hits)
+        if single_time:
+            start_dt = datetime.combine(date_context, single_time)
+            end_dt = start_dt + timedelta(hours=1)  # Default 1 hour duration
+            return start_dt, end_dt, time_token
+
+        return None, None, None
+
+    @staticmethod
+    def _parse_clock(value: str) -> Optional[time]:
+        """Parse a range bound; only HH:MM bounds carry a time"""
+        if ':' not in value:
+            return None
+        hour, minute = value.split(':')
+        return time(int(hour), int(minute))
+
+    def parse_date(self, text: str) -> Optional[date]:
+        """
+        Parse date from Russian text
+
+        Args:
+            text (str): Input text containing date
+
+        Returns:
+            Optional[date]: Parsed date or None
+        """
+        if not text:
+            return None
+
+        return self._resolve_date(self._cached_scan(text), text, date.today())
+
     def parse_time(self, text: str) -> Optional[time]:
         """
         Parse time from Russian text
@@ -137,51 +348,8 @@ class DateTimeParser:
         if not text:
             return None
 
-        text_lower = text.lower()
-
         try:
-            # Try different time patterns
-            for pattern in self.time_patterns:
-                match = re.search(pattern, text_lower)
-                if match:
-                    if pattern == r'(\d{1,2}):(\d{2})':  # HH:MM format
-                        hour = int(match.group(1))
-                        minute = int(match.group(2))
-                        return time(hour, minute)
-
-                    elif pattern == r'(\d{1,2})\s*ч(?:ас(?:а|ов)?)?\s*(\d{2})?':  # X час MM
-                        hour = int(match.group(1))
-                        minute = int(match.group(2)) if match.group(2) else 0
-                        return time(hour, minute)
-
-                    elif 'утра' in pattern:  # X утра
-                        hour = int(match.group(1))
-                        if hour == 12:
-                            hour = 0
-                        return time(hour, 0)
-
-                    elif 'дня' in pattern:  # X дня
-                        hour = int(match.group(1))
-                        if hour < 12:
-                            hour += 12
-                        return time(hour, 0)
-
-                    elif 'вечера' in pattern:  # X вечера
-                        hour = int(match.group(1))
-                        if hour < 12:
-                            hour += 12
-                        return time(hour, 0)
-
-            # Handle special time expressions
-            if 'утром' in text_lower or 'утра' in text_lower:
-                return time(9, 0)  # Default morning time
-            elif 'днем' in text_lower or 'дня' in text_lower:
-                return time(14, 0)  # Default afternoon time
-            elif 'вечером' in text_lower or 'вечера' in text_lower:
-                return time(18, 0)  # Default evening time
-            elif 'ночью' in text_lower or 'ночи' in text_lower:
-                return time(22, 0)  # Default night time
-
+            return self._resolve_time(self._cached_scan(text))[0]
         except Exception as e:
             logger.error(f"Error parsing time from '{text}': {e}")
 
@@ -201,50 +369,9 @@ class DateTimeParser:
         if not text or not date_context:
             return None, None
 
-        text_lower = text.lower()
-
         try:
-            # Look for time range patterns like "с 10 до 12" or "10-12"
-            range_patterns = [
-                r'с\s+(\d{1,2}(?::\d{2})?)\s+до\s+(\d{1,2}(?::\d{2})?)',
-                r'(\d{1,2}(?::\d{2})?)\s*-\s*(\d{1,2}(?::\d{2})?)',
-                r'с\s+(\d{1,2})\s+до\s+(\d{1,2})'
-            ]
-
-            for pattern in range_patterns:
-                match = re.search(pattern, text_lower)
-                if match:
-                    start_time_str = match.group(1)
-                    end_time_str = match.group(2)
-
-                    # Parse start time
-                    start_time = self.parse_time(start_time_str)
-                    if start_time:
-                        start_dt = datetime.combine(date_context, start_time)
-                    else:
-                        continue
-
-                    # Parse end time
-                    end_time = self.parse_time(end_time_str)
-                    if end_time:
-                        end_dt = datetime.combine(date_context, end_time)
-
-                        # If end time is before start time, assume next day
-                        if end_dt <= start_dt:
-                            end_dt = datetime.combine(date_context + timedelta(days=1), end_time)
-                    else:
-                        # Default 1 hour duration
-                        end_dt = start_dt + timedelta(hours=1)
-
-                    return start_dt, end_dt
-
-            # If no range found, parse single time and add default duration
-            single_time = self.parse_time(text)
-            if single_time:
-                start_dt = datetime.combine(date_context, single_time)
-                end_dt = start_dt + timedelta(hours=1)  # Default 1 hour duration
-                return start_dt, end_dt
-
+            start_dt, end_dt, _ = self._resolve_time_range(self._cached_scan(text), date_context)
+            return start_dt, end_dt
         except Exception as e:
             logger.error(f"Error parsing time range from '{text}': {e}")
 
@@ -263,17 +390,9 @@ class DateTimeParser:
         if not text:
             return None
 
-        text_lower = text.lower()
-
-        # Simple recurrence patterns
-        if any(word in text_lower for word in ['каждый день', 'ежедневно']):
-            return 'RRULE:FREQ=DAILY'
-        elif any(word in text_lower for word in ['каждую неделю', 'еженедельно']):
-            return 'RRULE:FREQ=WEEKLY'
-        elif any(word in text_lower for word in ['каждый месяц', 'ежемесячно']):
-            return 'RRULE:FREQ=MONTHLY'
-        elif any(word in text_lower for word in ['каждый год', 'ежегодно']):
-            return 'RRULE:FREQ=YEARLY'
+        recurrences = self._cached_scan(text).get('recurrence')
+        if recurrences:
+            return recurrences[0][0]
 
         return None
 
@@ -287,73 +406,46 @@ class DateTimeParser:
         Returns:
             Dict[str, Any]: Dictionary with parsed info including 'start', 'end', 'summary', 'matched_text'
         """
-        result = {
+        # Results are cached per day; hand out copies so callers can't alter cached entries
+        result = self._cached_parse_event(text, date.today())
+        return {**result, 'matched_text': list(result['matched_text'])}
+
+    def _parse_event(self, text: str, today: date) -> Dict[str, Any]:
+        result: Dict[str, Any] = {
             'date': None,
             'start': None,
             'end': None,
             'recurrence': None,
             'matched_text': []
         }
-        text_lower = text.lower()
-
         try:
-            # We will find all matches and then remove them from the text
-            # to avoid re-parsing
-            all_matches = []
+            # A single walk over the text collects every date, time and recurrence match
+            hits = self._cached_scan(text)
+            all_matches: List[str] = []
 
             # 1. Parse date
-            parsed_date = self.parse_date(text_lower)
+            parsed_date = self._resolve_date(hits, text, today)
             if parsed_date:
                 result['date'] = parsed_date
-                # This is tricky because parse_date doesn't return matched text
-                # We will re-run some regexes to find the matched text
-                date_keywords = [
-                    r'\bзавтра\b', r'\bсегодня\b', r'\bпослезавтра\b', r'\bвчера\b'
-                ] + list(self.weekdays.keys())
-                
-                for keyword in date_keywords:
-                    match = re.search(r'\b' + keyword + r'\b', text_lower)
-                    if match:
-                        all_matches.append(match.group(0))
-
-                month_pattern = r'(\d{1,2}\s+(' + '|'.join(self.months.keys()) + r'))'
-                month_match = re.search(month_pattern, text_lower)
-                if month_match:
-                    all_matches.append(month_match.group(1))
+                for kind in ('relative', 'weekday'):
+                    all_matches.extend(token for _, token in hits.get(kind, []))
+                if 'month_day' in hits:
+                    all_matches.append(hits['month_day'][0][1])
 
             # 2. Parse time range
             if result['date']:
-                start_dt, end_dt = self.parse_time_range(text_lower, result['date'])
-                if start_dt and end_dt:
+                start_dt, end_dt, token = self._resolve_time_range(hits, result['date'])
+                if start_dt and end_dt and token:
                     result['start'] = start_dt
                     result['end'] = end_dt
-                    
-                    # Again, find the matched text for time
-                    range_patterns = [
-                        r'с\s+\d{1,2}(?::\d{2})?\s+до\s+\d{1,2}(?::\d{2})?',
-                        r'\d{1,2}(?::\d{2})?\s*-\s*\d{1,2}(?::\d{2})?',
-                        r'\d{1,2}:\d{2}',
-                        r'\d{1,2}\s*ч(?:ас(?:а|ов)?)?\s*(\d{2})?',
-                        r'\d{1,2}\s*утра', r'\d{1,2}\s*дня', r'\d{1,2}\s*вечера'
-                    ]
-                    for pattern in range_patterns:
-                        match = re.search(pattern, text_lower)
-                        if match:
-                            all_matches.append(match.group(0))
+                    all_matches.append(token)
 
             # 3. Parse recurrence
-            recurrence_rule = self.parse_recurrence(text_lower)
-            if recurrence_rule:
-                result['recurrence'] = recurrence_rule
-                # Add matched recurrence text
-                rec_keywords = [
-                    r'каждый\s+день', r'каждую\s+неделю', r'каждый\s+месяц', r'каждый\s+год'
-                ]
-                for keyword in rec_keywords:
-                    match = re.search(keyword, text_lower)
-                    if match:
-                        all_matches.append(match.group(0))
-            
+            recurrences = hits.get('recurrence')
+            if recurrences:
+                result['recurrence'] = recurrences[0][0]
+                all_matches.extend(token for _, token in recurrences)
+
             # Store unique matched text snippets
             result['matched_text'] = list(set(all_matches))
 
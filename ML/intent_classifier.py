@@ -1,39 +1,104 @@
 import os
-import pickle
+import re
+import numpy as np
 import pandas as pd
 import logging
 import joblib
-from typing import List, Optional
+from functools import lru_cache
+from itertools import chain
+from math import ceil
+from typing import List, Optional, Sequence
+from joblib import Parallel, delayed
+from scipy import sparse
+from spacy.lang.ru.stop_words import STOP_WORDS
 from sklearn.pipeline import Pipeline
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.svm import LinearSVC
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+from sklearn.linear_model import SGDClassifier
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report, accuracy_score
 
-from text_processor import TextProcessor
+from text_processor import get_text_processor
 
 logger = logging.getLogger(__name__)
 
+# Rule-based intent keywords, checked in this order
+INTENT_KEYWORDS = {
+    "ADD_EVENT": ('добавь', 'создай', 'поставь', 'запланируй', 'занеси', 'назначь'),
+    "DELETE_EVENT": ('удали', 'отмени', 'убери', 'сотри'),
+    "MOVE_EVENT": ('перенеси', 'измени', 'сдвинь', 'перепланируй'),
+    "CHECK_EVENTS": ('покажи', 'что у меня', 'расписание', 'планы', 'события')
+}
+
+# One case-insensitive alternation per intent, compiled once at import
+ADD_RE, DEL_RE, MOVE_RE, CHECK_RE = (
+    re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+    for keywords in INTENT_KEYWORDS.values()
+)
+INTENT_PATTERNS = dict(zip(INTENT_KEYWORDS, (ADD_RE, DEL_RE, MOVE_RE, CHECK_RE)))
+
+# Russian stop words carry no intent, except those the keywords are built from ("что у меня")
+RUSSIAN_STOPWORDS = frozenset(STOP_WORDS) - {
+    word for keywords in INTENT_KEYWORDS.values() for keyword in keywords for word in keyword.split()
+}
+
+# Training sets larger than this are hashed chunk by chunk before fitting
+TRAIN_CHUNK_SIZE = 100_000
+
+# Columns at least this long are preprocessed in worker processes
+PARALLEL_PREPROCESS_MIN_SIZE = 10_000
+
+
+def _preprocess_chunk(texts: Sequence[str], language: str) -> List[str]:
+    """Preprocess one chunk of texts for classification in a worker process"""
+    # Only the language crosses the process boundary; the processor (with its
+    # spaCy model and lemma cache) is built once per worker
+    text_processor = get_text_processor(language)
+    return [text_processor.preprocess_for_classification(text) for text in texts]
+
 
 class IntentClassifier:
     """
     Intent classifier for calendar operations using TF-IDF and SVM
     """
 
-    def __init__(self):
+    def __init__(self, confidence_threshold: Optional[float] = 0.5):
+        # Predictions scoring below the threshold become UNKNOWN; None disables the gate
+        self.confidence_threshold = confidence_threshold
         self.pipeline = Pipeline([
-            ('tfidf', TfidfVectorizer(
-                max_features=5000,
+            # Hashing keeps no vocabulary, so fitting needs no pass to build one
+            ('hv', HashingVectorizer(
+                n_features=2 ** 16,
                 ngram_range=(1, 2),
-                min_df=2,
-                max_df=0.95
+                alternate_sign=False,
+                norm=None,
+                dtype=np.float32,
+                # Input is already lowercased by preprocess_for_classification
+                lowercase=False,
+                token_pattern=r"(?u)\b\w+\b",
+                stop_words=sorted(RUSSIAN_STOPWORDS)
             )),
-            ('clf', LinearSVC(random_state=42, max_iter=10000))
+            ('tfidf', TfidfTransformer(sublinear_tf=True, norm='l2')),
+            # Linear SVM (hinge loss) trained by SGD; averaging stabilises the final weights
+            ('clf', SGDClassifier(
+                loss='hinge',
+                alpha=1e-5,
+                max_iter=50,
+                tol=1e-4,
+                average=True,
+                n_jobs=-1,
+                random_state=42
+            ))
         ])
         self.classes = ["ADD_EVENT", "DELETE_EVENT", "MOVE_EVENT", "CHECK_EVENTS", "UNKNOWN"]
-        self.text_processor = TextProcessor()
+        self.text_processor = get_text_processor()
         self.is_trained = False
 
+        # Users repeat the same phrases a lot, so memoize per instance.
+        # Predictions are keyed on the preprocessed text and cleared whenever the model is refit.
+        self._preprocess = lru_cache(maxsize=8192)(self.text_processor.preprocess_for_classification)
+        self._predict_processed_text = lru_cache(maxsize=4096)(self._predict_processed_text)
+        self._map_template_to_intent = lru_cache(maxsize=1024)(self._map_template_to_intent)
+
     def _map_template_to_intent(self, template: str) -> str:
         """
         Map template strings to intent labels
@@ -44,32 +109,44 @@ class IntentClassifier:
         Returns:
             str: Intent label
         """
-        template_lower = template.lower()
+        # One scan per intent, in priority order
+        for intent, pattern in INTENT_PATTERNS.items():
+            if pattern.search(template):
+                return intent
 
-        # Keywords for different intents
-        add_keywords = ['добавь', 'создай', 'поставь', 'запланируй', 'занеси', 'назначь']
-        delete_keywords = ['удали', 'отмени', 'убери', 'сотри']
-        move_keywords = ['перенеси', 'измени', 'сдвинь', 'перепланируй']
-        check_keywords = ['покажи', 'что у меня', 'расписание', 'планы', 'события']
+        return "UNKNOWN"
 
-        # Check for keywords
-        for keyword in add_keywords:
-            if keyword in template_lower:
-                return "ADD_EVENT"
+    def _map_templates_to_intents(self, templates: pd.Series) -> np.ndarray:
+        """
+        Map a column of template strings to intent labels in one pass per intent
 
-        for keyword in delete_keywords:
-            if keyword in template_lower:
-                return "DELETE_EVENT"
+        Args:
+            templates (pd.Series): Template strings
 
-        for keyword in move_keywords:
-            if keyword in template_lower:
-                return "MOVE_EVENT"
+        Returns:
+            np.ndarray: Intent labels, same rules and priority as _map_template_to_intent
+        """
+        conditions = [templates.str.contains(pattern, na=False) for pattern in INTENT_PATTERNS.values()]
+        return np.select(conditions, list(INTENT_PATTERNS), default="UNKNOWN")
 
-        for keyword in check_keywords:
-            if keyword in template_lower:
-                return "CHECK_EVENTS"
+    def _bulk_preprocess(self, texts: Sequence[str]) -> List[str]:
+        """
+        Preprocess a whole column for classification, in parallel when it is large
 
-        return "UNKNOWN"
+        Args:
+            texts (Sequence[str]): Input texts
+
+        Returns:
+            List[str]: Preprocessed texts, in input order
+        """
+        if len(texts) < PARALLEL_PREPROCESS_MIN_SIZE:
+            return [self._preprocess(text) for text in texts]
+
+        chunks = np.array_split(np.asarray(texts, dtype=object), os.cpu_count() or 1)
+        processed_chunks = Parallel(n_jobs=-1, backend='loky')(
+            delayed(_preprocess_chunk)(chunk, self.text_processor.language) for chunk in chunks
+        )
+        return list(chain.from_iterable(processed_chunks))
 
     def train(self, df: pd.DataFrame, text_column: str = 'text', template_column: str = 'template'):
         """
@@ -83,31 +160,40 @@ class IntentClassifier:
         try:
             # If template column exists, map templates to intents
             if template_column in df.columns:
-                df['intent'] = df[template_column].apply(self._map_template_to_intent)
+                df['intent'] = self._map_templates_to_intents(df[template_column])
             elif 'intent' not in df.columns:
                 # If no intent column, try to infer from text
                 logger.warning("No intent or template column found. Inferring intents from text.")
-                df['intent'] = df[text_column].apply(self._map_template_to_intent)
+                df['intent'] = self._map_templates_to_intents(df[text_column])
 
-            # Preprocess text
-            X = df[text_column].apply(self.text_processor.preprocess_for_classification)
-            y = df['intent']
+            # Filter out unknown intents for training, before any preprocessing
+            # Masking the underlying arrays avoids building intermediate Series
+            mask = (df['intent'] != "UNKNOWN").to_numpy()
+            y_filtered = df['intent'].to_numpy()[mask]
 
-            # Filter out unknown intents for training
-            mask = y != "UNKNOWN"
-            X_filtered = X[mask]
-            y_filtered = y[mask]
+            # Preprocess text
+            X_filtered = self._bulk_preprocess(df[text_column].to_numpy()[mask])
 
             if len(X_filtered) == 0:
                 raise ValueError("No valid training examples found")
 
             # Train the model
-            self.pipeline.fit(X_filtered, y_filtered)
+            if len(X_filtered) > TRAIN_CHUNK_SIZE:
+                # Hashing is stateless, so chunks can be hashed separately and stacked
+                chunks = np.array_split(
+                    np.asarray(X_filtered, dtype=object), ceil(len(X_filtered) / TRAIN_CHUNK_SIZE)
+                )
+                hashed = sparse.vstack([self.pipeline.named_steps['hv'].transform(chunk) for chunk in chunks])
+                self.pipeline[1:].fit(hashed, y_filtered)
+            else:
+                self.pipeline.fit(X_filtered, y_filtered)
             self.is_trained = True
+            self._predict_processed_text.cache_clear()
 
             # Log training statistics
             logger.info(f"Trained intent classifier on {len(X_filtered)} examples")
-            logger.info(f"Intent distribution: {y_filtered.value_counts().to_dict()}")
+            intents, counts = np.unique(y_filtered, return_counts=True)
+            logger.info(f"Intent distribution: {dict(zip(intents.tolist(), counts.tolist()))}")
 
         except Exception as e:
             logger.error(f"Error training intent classifier: {e}")
@@ -127,31 +213,116 @@ class IntentClassifier:
             logger.warning("Model not trained. Using rule-based classification.")
             return self._map_template_to_intent(text)
 
+        direct_intent = self._predict_directly(text)
+        if direct_intent is not None:
+            return direct_intent
+
         try:
             # Preprocess text
-            processed_text = self.text_processor.preprocess_for_classification(text)
+            processed_text = self._preprocess(text)
 
-            # Predict
-            prediction = self.pipeline.predict([processed_text])[0]
+            return self._predict_processed_text(processed_text)
 
-            # Get prediction probability/confidence
-            try:
-                decision_scores = self.pipeline.decision_function([processed_text])[0]
-                max_score = max(decision_scores)
+        except Exception as e:
+            logger.error(f"Error predicting intent: {e}")
+            return "UNKNOWN"
 
-                # If confidence is too low, return UNKNOWN
-                if max_score < 0.5:
-                    return "UNKNOWN"
+    def _predict_directly(self, text: str) -> Optional[str]:
+        """
+        Answer trivial inputs without running the model
 
-            except Exception:
-                pass  # Some classifiers don't support decision_function
+        Args:
+            text (str): Input text
 
-            return prediction
+        Returns:
+            Optional[str]: Intent, or None if the model is needed
+        """
+        stripped = text.strip()
 
-        except Exception as e:
-            logger.error(f"Error predicting intent: {e}")
+        # Empty, digits-only or punctuation-only input carries no intent
+        if not any(char.isalpha() for char in stripped):
             return "UNKNOWN"
 
+        # One- or two-word commands with a keyword are settled by the rules;
+        # the vocabulary barely covers such short strings anyway
+        if len(stripped.split()) <= 2:
+            intent = self._map_template_to_intent(stripped)
+            if intent != "UNKNOWN":
+                return intent
+
+        return None
+
+    def _predict_processed_text(self, processed_text: str) -> str:
+        """
+        Predict intent for one preprocessed text
+
+        Args:
+            processed_text (str): Text after preprocess_for_classification
+
+        Returns:
+            str: Predicted intent
+        """
+        return str(self._predict_processed([processed_text])[0])
+
+    def predict_batch(self, texts: List[str]) -> List[str]:
+        """
+        Predict intents for several texts with a single model call
+
+        Args:
+            texts (List[str]): Input texts
+
+        Returns:
+            List[str]: Predicted intents, in input order
+        """
+        if not texts:
+            return []
+
+        if not self.is_trained:
+            logger.warning("Model not trained. Using rule-based classification.")
+            return [self._map_template_to_intent(text) for text in texts]
+
+        intents = [self._predict_directly(text) for text in texts]
+        pending = [index for index, intent in enumerate(intents) if intent is None]
+        if not pending:
+            return intents
+
+        try:
+            processed_texts = [self._preprocess(texts[index]) for index in pending]
+            predictions = self._predict_processed(processed_texts).tolist()
+        except Exception as e:
+            logger.error(f"Error predicting intents: {e}")
+            predictions = ["UNKNOWN"] * len(pending)
+
+        for index, prediction in zip(pending, predictions):
+            intents[index] = prediction
+        return intents
+
+    def _predict_processed(self, processed_texts: List[str]) -> np.ndarray:
+        """
+        Predict intents for preprocessed texts, applying the confidence gate
+
+        Args:
+            processed_texts (List[str]): Texts after preprocess_for_classification
+
+        Returns:
+            np.ndarray: Predicted intents
+        """
+        if self.confidence_threshold is None or not hasattr(self.pipeline, 'decision_function'):
+            return self.pipeline.predict(processed_texts)
+
+        # One scoring pass gives both the label (argmax) and its confidence
+        decision_scores = self.pipeline.decision_function(processed_texts)
+        if decision_scores.ndim == 1:
+            # Binary models return the score of the positive class only
+            decision_scores = np.column_stack([-decision_scores, decision_scores])
+
+        best = decision_scores.argmax(axis=1)
+        predictions = self.pipeline.classes_[best]
+
+        # If confidence is too low, return UNKNOWN
+        confident = decision_scores[np.arange(len(best)), best] >= self.confidence_threshold
+        return np.where(confident, predictions, "UNKNOWN")
+
     def evaluate(self, test_df: pd.DataFrame, text_column: str = 'text',
                  template_column: str = 'template') -> dict:
         """
@@ -170,13 +341,19 @@ class IntentClassifier:
 
         # Prepare test data
         if template_column in test_df.columns:
-            test_df['intent'] = test_df[template_column].apply(self._map_template_to_intent)
+            test_df['intent'] = self._map_templates_to_intents(test_df[template_column])
 
-        X_test = test_df[text_column].apply(self.text_processor.preprocess_for_classification)
+        texts = test_df[text_column].tolist()
         y_test = test_df['intent']
 
-        # Predict
-        y_pred = [self.predict(text) for text in test_df[text_column]]
+        # Score what callers get: trivial inputs are answered like predict/predict_batch
+        # do, and the rest are preprocessed and predicted as one batch
+        y_pred = [self._predict_directly(text) for text in texts]
+        pending = [index for index, intent in enumerate(y_pred) if intent is None]
+        if pending:
+            X_test = self._bulk_preprocess([texts[index] for index in pending])
+            for index, prediction in zip(pending, self._predict_processed(X_test).tolist()):
+                y_pred[index] = prediction
 
         # Calculate metrics
         accuracy = accuracy_score(y_test, y_pred)
@@ -199,12 +376,11 @@ class IntentClassifier:
 
         try:
             os.makedirs(os.path.dirname(path), exist_ok=True)
-            with open(path, 'wb') as f:
-                pickle.dump({
-                    'pipeline': self.pipeline,
-                    'classes': self.classes,
-                    'is_trained': self.is_trained
-                }, f)
+            joblib.dump({
+                'pipeline': self.pipeline,
+                'classes': self.classes,
+                'is_trained': self.is_trained
+            }, path, compress=3, protocol=5)
             logger.info(f"Model saved to {path}")
         except Exception as e:
             logger.error(f"Error saving model: {e}")
@@ -222,8 +398,18 @@ class IntentClassifier:
             IntentClassifier: Loaded classifier instance
         """
         try:
+            state = joblib.load(path)
+
             classifier = cls()
-            classifier.pipeline = joblib.load(path)
+            if isinstance(state, Pipeline):
+                # Older models (such as the shipped one) were saved as a bare fitted Pipeline
+                classifier.pipeline = state
+                classifier.classes = [str(intent) for intent in state.classes_]
+                classifier.is_trained = True
+            else:
+                classifier.pipeline = state['pipeline']
+                classifier.classes = state['classes']
+                classifier.is_trained = state['is_trained']
 
             print(f"Model loaded from {path}")
             return classifier
@@ -269,4 +455,7 @@ def create_sample_training_data() -> pd.DataFrame:
         ("Какая погода", "UNKNOWN")
     ]
 
-    return pd.DataFrame(sample_data, columns=['text', 'intent'])
+    texts, intents = zip(*sample_data)
+    return pd.DataFrame({'text': list(texts), 'intent': list(intents)}).astype(
+        {'text': 'string', 'intent': 'category'}
+    )
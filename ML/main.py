@@ -10,20 +10,25 @@ import json
 import logging
 import argparse
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
+
+import orjson
 
 # Add current directory to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from config import LOGGING_CONFIG
-from pipeline import SchedyPipeline
-from intent_classifier import IntentClassifier, create_sample_training_data
-from ner_extractor import create_sample_ner_data
-from calendar_client import setup_google_calendar_credentials
+
+# The pipeline, classifier and calendar modules pull in spaCy, scikit-learn and the
+# Google client; they are imported by the commands that need them, so --help and
+# setup start without loading any models
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# process-file handles lines in batches of this size, so results never pile up for the whole file
+PROCESS_FILE_BATCH_SIZE = 1000
+
 
 class SchedyApp:
     """
@@ -37,6 +42,7 @@ class SchedyApp:
     def _initialize_pipeline(self):
         """Initialize the ML pipeline"""
         try:
+            from pipeline import SchedyPipeline
             self.pipeline = SchedyPipeline()
             logger.info("Schedy pipeline initialized successfully")
         except Exception as e:
@@ -62,7 +68,22 @@ class SchedyApp:
         else:
             return self.pipeline.process_text(text)
 
-    def process_file(self, file_path: str, create_events: bool = False) -> List[Dict[str, Any]]:
+    def create_event_from_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create calendar event for an already processed text
+
+        Args:
+            result (Dict[str, Any]): Result of process_text
+
+        Returns:
+            Dict[str, Any]: The same result with event creation status
+        """
+        if not self.pipeline:
+            raise RuntimeError("Pipeline not initialized")
+
+        return self.pipeline.create_event_from_result(result)
+
+    def process_file(self, file_path: str, create_events: bool = False) -> Iterator[Dict[str, Any]]:
         """
         Process text from file
 
@@ -70,38 +91,50 @@ class SchedyApp:
             file_path (str): Path to text file
             create_events (bool): Whether to create calendar events
 
-        Returns:
-            List[Dict[str, Any]]: Processing results for each line
+        Yields:
+            Dict[str, Any]: Processing result for each non-empty line, in file order
         """
+        if not self.pipeline:
+            raise RuntimeError("Pipeline not initialized")
+
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        results = []
         try:
+            # Read the whole file at once; newlines are already normalized to '\n'
             with open(file_path, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
+                lines = [line.strip() for line in f.read().split('\n')]
 
-                    logger.info(f"Processing line {line_num}: {line}")
-                    result = self.process_text(line, create_events)
+            line_numbers = [line_num for line_num, line in enumerate(lines, 1) if line]
+            lines = [line for line in lines if line]
+
+            logger.info(f"Processing {len(lines)} lines from {file_path}")
+            for start in range(0, len(lines), PROCESS_FILE_BATCH_SIZE):
+                # Classify each batch of lines in one call
+                batch = lines[start:start + PROCESS_FILE_BATCH_SIZE]
+                if create_events:
+                    results = self.pipeline.process_and_create_events(batch)
+                else:
+                    results = self.pipeline.process_texts(batch)
+
+                for line_num, result in zip(line_numbers[start:start + PROCESS_FILE_BATCH_SIZE], results):
                     result['line_number'] = line_num
-                    results.append(result)
+                    yield result
 
         except Exception as e:
             logger.error(f"Error processing file {file_path}: {e}")
             raise
 
-        return results
-
-    def train_intent_classifier(self, data_path: str = None):
+    @staticmethod
+    def train_intent_classifier(data_path: str = None):
         """
         Train the intent classifier
 
         Args:
             data_path (str): Path to training data CSV file
         """
+        from intent_classifier import IntentClassifier, create_sample_training_data
+
         try:
             if data_path and os.path.exists(data_path):
                 import pandas as pd
@@ -140,8 +173,10 @@ class SchedyApp:
 
         return self.pipeline.get_upcoming_events(days)
 
-    def setup_calendar(self):
+    @staticmethod
+    def setup_calendar():
         """Setup Google Calendar credentials"""
+        from calendar_client import setup_google_calendar_credentials
         setup_google_calendar_credentials()
 
 
@@ -165,7 +200,7 @@ def main():
     file_parser.add_argument('file', help='File to process')
     file_parser.add_argument('--create-events', action='store_true',
                              help='Create calendar events')
-    file_parser.add_argument('--output', help='Output file for results (JSON)')
+    file_parser.add_argument('--output', help='Output file for results (JSON Lines)')
 
     # Train command
     train_parser = subparsers.add_parser('train', help='Train models')
@@ -189,6 +224,16 @@ def main():
         return
 
     try:
+        # These commands need no pipeline, so don't load one
+        if args.command == 'train':
+            SchedyApp.train_intent_classifier(args.data)
+            print("Training completed successfully")
+            return
+
+        if args.command == 'setup':
+            SchedyApp.setup_calendar()
+            return
+
         app = SchedyApp()
 
         if args.command == 'process':
@@ -205,17 +250,15 @@ def main():
             results = app.process_file(args.file, args.create_events)
 
             if args.output:
-                with open(args.output, 'w', encoding='utf-8') as f:
-                    json.dump(results, f, ensure_ascii=False, indent=2, default=str)
+                # One JSON object per line, written as results arrive
+                with open(args.output, 'wb') as f:
+                    for result in results:
+                        f.write(orjson.dumps(result, default=str, option=orjson.OPT_APPEND_NEWLINE))
                 print(f"Results saved to {args.output}")
             else:
                 for result in results:
                     print(f"Line {result['line_number']}: {result}")
 
-        elif args.command == 'train':
-            app.train_intent_classifier(args.data)
-            print("Training completed successfully")
-
         elif args.command == 'events':
             events = app.get_upcoming_events(args.days)
             if events:
@@ -228,9 +271,6 @@ def main():
             else:
                 print("No upcoming events found")
 
-        elif args.command == 'setup':
-            app.setup_calendar()
-
         elif args.command == 'interactive':
             interactive_mode(app)
 
@@ -309,7 +349,8 @@ Available commands:
 
                     create = input("Create this event in calendar? (y/n): ").lower()
                     if create in ['y', 'yes', 'да']:
-                        event_result = app.process_text(user_input, create_event=True)
+                        # Reuse the result shown above instead of running the pipeline again
+                        event_result = app.create_event_from_result(result)
                         if event_result.get('calendar_created'):
                             print(f"✓ Event created with ID: {event_result.get('event_id')}")
                         else:
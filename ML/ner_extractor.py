@@ -1,24 +1,75 @@
 import os
+import re
+import random
 import spacy
 from spacy.training import Example
+from spacy.util import minibatch, compounding
 from spacy.tokens import DocBin
 import logging
-from typing import Dict, List, Any, Optional
+from typing import AbstractSet, Dict, List, Any, Optional
 import json
 
-from text_processor import TextProcessor
+from text_processor import get_text_processor
 
 logger = logging.getLogger(__name__)
 
+# Pipeline components that entity extraction depends on, any other component
+# of a loaded model (tagger, parser, lemmatizer...) is skipped at inference
+NER_INFERENCE_PIPES = frozenset({"tok2vec", "transformer", "ner"})
+
+# Fallback entity patterns, compiled once for every extractor. They stay on the
+# standard re module: Hyperscan only reports where a match ends, while every
+# pattern here is needed for its capture group, and google-re2 is no faster on
+# these short inputs because its per-call overhead outweighs the scan itself.
+# A keyword prescreen (e.g. Aho-Corasick) wouldn't pay off either: "с", "к",
+# "в" and "на" before a space occur in nearly every sentence.
+# PERSON entities (names after prepositions), matched on the original text.
+# "вместе с" and "встреча с" need no pattern of their own: any name they
+# precede is already found after the bare "с" by the first pattern.
+PERSON_PATTERNS = [
+    re.compile(r'(?:с|со)\s+([А-ЯЁ][а-яё]+(?:\s+[А-ЯЁ][а-яё]+)?)'),
+    re.compile(r'(?:к|ко)\s+([А-ЯЁ][а-яё]+(?:\s+[А-ЯЁ][а-яё]+)?)')
+]
+
+# EVENT entities, matched on the lowercased text
+EVENT_PATTERNS = [
+    re.compile(r'(?:встречу|событие|мероприятие|презентацию|собрание)\s+([^\s]+(?:\s+[^\s]+)*?)(?:\s+на|\s+в|$)'),
+    re.compile(r'(?:запланируй|добавь|создай)\s+([^\s]+(?:\s+[^\s]+)*?)(?:\s+на|\s+в|$)')
+]
+
+# LOCATION entities, matched on the original text
+LOCATION_PATTERNS = [
+    re.compile(r'(?:в|на)\s+(офисе|доме|работе|[А-ЯЁ][а-яё]+(?:\s+[А-ЯЁ][а-яё]+)*?)(?:\s|$)'),
+    re.compile(r'(?:адрес|место|по адресу)\s+([^\n]+)')
+]
+
+# Labels the fallback patterns can extract
+PATTERN_LABELS = frozenset({'PERSON', 'EVENT', 'LOCATION'})
+
+# Words the EVENT patterns capture that are not event names
+NON_EVENT_WORDS = frozenset({'встречу', 'событие', 'мероприятие', 'презентацию'})
+
 class NERExtractor:
     """
-    Named Entity Recognition extractor for Russian text
+    Named Entity Recognition extractor for Russian text.
+    With use_gpu=True it calls spacy.prefer_gpu(), which switches the Thinc backend for
+    the whole process: spaCy models loaded afterwards, e.g. by the text processor, also
+    run on the GPU.
     """
 
-    def __init__(self, model_path: Optional[str] = None, language: str = "ru"):
+    def __init__(self, model_path: Optional[str] = None, language: str = "ru", batch_size: int = 64,
+                 use_gpu: bool = False):
         self.language = language
         self.model_path = model_path
-        self.text_processor = TextProcessor(language)
+        # Number of texts spaCy packs together in extract_entities_batch
+        self.batch_size = batch_size
+
+        # Allocate the model on the GPU when one is available (process-wide, see the class
+        # docstring); this has to happen before the model is created or loaded, and falls
+        # back to the CPU otherwise
+        if use_gpu and spacy.prefer_gpu():
+            logger.info("Running NER model on GPU")
+        self.text_processor = get_text_processor(language)
 
         # Entity labels
         self.entity_labels = ["PERSON", "TIME", "DATE", "EVENT", "LOCATION", "DURATION"]
@@ -29,6 +80,9 @@ class NERExtractor:
         else:
             self.nlp = self.create_model()
 
+        # Components to turn off when only doc.ents is needed
+        self._inference_disable = [name for name in self.nlp.pipe_names if name not in NER_INFERENCE_PIPES]
+
     def create_model(self):
         """
         Create a new NER model
@@ -80,12 +134,13 @@ class NERExtractor:
             logger.info("Creating new model instead")
             return self.create_model()
 
-    def extract_entities(self, text: str) -> Dict[str, str]:
+    def extract_entities(self, text: str, already_cleaned: bool = False) -> Dict[str, str]:
         """
         Extract entities from text
 
         Args:
             text (str): Input text
+            already_cleaned (bool): Whether text is already the output of clean_and_preprocess_text
 
         Returns:
             Dict[str, str]: Dictionary of extracted entities
@@ -95,87 +150,135 @@ class NERExtractor:
 
         try:
             # Clean text
-            cleaned_text = self.text_processor.clean_and_preprocess_text(text)
+            cleaned_text = text if already_cleaned else self.text_processor.clean_and_preprocess_text(text)
 
             # Process with NER model
-            doc = self.nlp(cleaned_text)
+            with self.nlp.select_pipes(disable=self._inference_disable):
+                doc = self.nlp(cleaned_text)
 
-            # Extract entities
-            entities = {}
-            for ent in doc.ents:
-                label = ent.label_
-                entity_text = self.text_processor.clean_entity_text(ent.text, label)
+            return self._entities_from_doc(doc, cleaned_text)
+
+        except Exception as e:
+            logger.error(f"Error extracting entities from '{text}': {e}")
+            return self._extract_entities_with_patterns(text)
 
-                # Store the first occurrence of each entity type
-                if label not in entities and entity_text:
-                    entities[label] = entity_text
+    def extract_entities_batch(self, texts: List[str], already_cleaned: bool = False) -> List[Dict[str, str]]:
+        """
+        Extract entities from several texts, running the NER model over them in batches
 
-            # Fallback entity extraction using patterns
-            entities.update(self._extract_entities_with_patterns(cleaned_text))
+        Args:
+            texts (List[str]): Input texts
+            already_cleaned (bool): Whether texts are already the output of clean_and_preprocess_text
 
-            return entities
+        Returns:
+            List[Dict[str, str]]: Dictionary of extracted entities for each text, in input order
+        """
+        results: List[Dict[str, str]] = [{} for _ in texts]
+
+        # Empty texts have no entities and are not sent to the model
+        indices = [index for index, text in enumerate(texts) if text]
+        if not indices:
+            return results
+
+        try:
+            if already_cleaned:
+                cleaned_texts = [texts[index] for index in indices]
+            else:
+                cleaned_texts = [self.text_processor.clean_and_preprocess_text(texts[index]) for index in indices]
+
+            # Process with NER model, one batch of documents at a time
+            docs = self.nlp.pipe(
+                cleaned_texts,
+                batch_size=self.batch_size,
+                disable=self._inference_disable,
+                n_process=1
+            )
+            for index, cleaned_text, doc in zip(indices, cleaned_texts, docs):
+                results[index] = self._entities_from_doc(doc, cleaned_text)
+
+            return results
 
         except Exception as e:
-            logger.error(f"Error extracting entities from '{text}': {e}")
-            return self._extract_entities_with_patterns(text)
+            logger.error(f"Error extracting entities in batch: {e}")
+            return [self.extract_entities(text, already_cleaned) for text in texts]
+
+    def _entities_from_doc(self, doc, cleaned_text: str) -> Dict[str, str]:
+        """
+        Collect entities found by the NER model, completed with pattern-based ones
+
+        Args:
+            doc (spacy.tokens.Doc): Processed document
+            cleaned_text (str): Cleaned text the document was built from
+
+        Returns:
+            Dict[str, str]: Dictionary of extracted entities
+        """
+        entities = {}
+        for ent in doc.ents:
+            label = ent.label_
 
-    def _extract_entities_with_patterns(self, text: str) -> Dict[str, str]:
+            # Store the first occurrence of each entity type; later ones aren't cleaned at all
+            if label in entities:
+                continue
+
+            entity_text = self.text_processor.clean_entity_text(ent.text, label)
+            if entity_text:
+                entities[label] = entity_text
+
+        # Fallback entity extraction using patterns, for the labels the model didn't find
+        if not PATTERN_LABELS <= entities.keys():
+            entities.update(self._extract_entities_with_patterns(cleaned_text, found=entities.keys()))
+
+        return entities
+
+    def _extract_entities_with_patterns(self, text: str, found: AbstractSet[str] = frozenset()) -> Dict[str, str]:
         """
         Fallback entity extraction using regex patterns
 
         Args:
             text (str): Input text
+            found (AbstractSet[str]): Labels already extracted, whose patterns are skipped
 
         Returns:
             Dict[str, str]: Dictionary of extracted entities
         """
-        import re
-
         entities = {}
-        text_lower = text.lower()
+
+        # Every pattern needs a keyword, whitespace and another word after it,
+        # so a text without two words can't match any of them
+        if len(text.split(None, 1)) < 2:
+            return entities
 
         try:
             # Extract PERSON entities (names after prepositions)
-            person_patterns = [
-                r'(?:с|со|вместе с)\s+([А-ЯЁ][а-яё]+(?:\s+[А-ЯЁ][а-яё]+)?)',
-                r'(?:встреча с|встреча с)\s+([А-ЯЁ][а-яё]+(?:\s+[А-ЯЁ][а-яё]+)?)',
-                r'(?:к|ко)\s+([А-ЯЁ][а-яё]+(?:\s+[А-ЯЁ][а-яё]+)?)'
-            ]
-
-            for pattern in person_patterns:
-                match = re.search(pattern, text)
-                if match and 'PERSON' not in entities:
-                    entities['PERSON'] = match.group(1).strip()
-                    break
+            if 'PERSON' not in found:
+                for pattern in PERSON_PATTERNS:
+                    match = pattern.search(text)
+                    if match and 'PERSON' not in entities:
+                        entities['PERSON'] = match.group(1).strip()
+                        break
 
             # Extract EVENT entities
-            event_patterns = [
-                r'(?:встречу|событие|мероприятие|презентацию|собрание)\s+([^\s]+(?:\s+[^\s]+)*?)(?:\s+на|\s+в|$)',
-                r'(?:запланируй|добавь|создай)\s+([^\s]+(?:\s+[^\s]+)*?)(?:\s+на|\s+в|$)'
-            ]
-
-            for pattern in event_patterns:
-                match = re.search(pattern, text_lower)
-                if match and 'EVENT' not in entities:
-                    event_text = match.group(1).strip()
-                    # Filter out common non-event words
-                    if event_text not in ['встречу', 'событие', 'мероприятие', 'презентацию']:
-                        entities['EVENT'] = event_text.title()
-                        break
+            if 'EVENT' not in found:
+                text_lower = text.lower()
+                for pattern in EVENT_PATTERNS:
+                    match = pattern.search(text_lower)
+                    if match and 'EVENT' not in entities:
+                        event_text = match.group(1).strip()
+                        # Filter out common non-event words
+                        if event_text not in NON_EVENT_WORDS:
+                            entities['EVENT'] = event_text.title()
+                            break
 
             # Extract LOCATION entities
-            location_patterns = [
-                r'(?:в|на)\s+(офисе|доме|работе|[А-ЯЁ][а-яё]+(?:\s+[А-ЯЁ][а-яё]+)*?)(?:\s|$)',
-                r'(?:адрес|место|по адресу)\s+([^\n]+)'
-            ]
-
-            for pattern in location_patterns:
-                match = re.search(pattern, text)
-                if match and 'LOCATION' not in entities:
-                    location = match.group(1).strip()
-                    if len(location) > 1:  # Avoid single characters
-                        entities['LOCATION'] = location
-                        break
+            if 'LOCATION' not in found:
+                for pattern in LOCATION_PATTERNS:
+                    match = pattern.search(text)
+                    if match and 'LOCATION' not in entities:
+                        location = match.group(1).strip()
+                        if len(location) > 1:  # Avoid single characters
+                            entities['LOCATION'] = location
+                            break
 
         except Exception as e:
             logger.error(f"Error in pattern-based entity extraction: {e}")
@@ -206,12 +309,14 @@ class NERExtractor:
                 examples.append(example)
 
             # Initialize the model
-            self.nlp.initialize(lambda: examples)
+            optimizer = self.nlp.initialize(lambda: examples)
 
-            # Train the model
+            # Train the model on shuffled minibatches growing from 4 to 32 examples
             for epoch in range(epochs):
+                random.shuffle(examples)
                 losses = {}
-                self.nlp.update(examples, losses=losses)
+                for batch in minibatch(examples, size=compounding(4.0, 32.0, 1.001)):
+                    self.nlp.update(batch, sgd=optimizer, losses=losses)
                 logger.info(f"Epoch {epoch + 1}/{epochs}, Losses: {losses}")
 
             logger.info("NER model training completed")
@@ -7,14 +7,16 @@ import os
 import json
 import logging
 import re
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from functools import cached_property
 from typing import Dict, List, Optional, Any
 
 from config import (
     MODEL_CONFIG, TEXT_PROCESSING_CONFIG, GOOGLE_CALENDAR_CONFIG, 
     DEFAULT_EVENT_TEMPLATE
 )
-from text_processor import TextProcessor
+from text_processor import TextProcessor, get_text_processor
 from intent_classifier import IntentClassifier
 from datetime_parser import DateTimeParser
 from ner_extractor import NERExtractor
@@ -22,6 +24,19 @@ from calendar_client import GoogleCalendarClient, EventBuilder
 
 logger = logging.getLogger(__name__)
 
+# Settings read on every processed text or calendar call; the configuration
+# is fixed once imported, so they are looked up a single time
+TIMEZONE = TEXT_PROCESSING_CONFIG['timezone']
+CALENDAR_ID = GOOGLE_CALENDAR_CONFIG['calendar_id']
+
+# Number of texts whose cleaned text, intent and entities are kept for reuse
+INFERENCE_CACHE_SIZE = 4096
+
+# Entity labels written with every word capitalized (people and places),
+# and with only the first word of the phrase capitalized (event titles)
+CAPITALIZED_WORD_LABELS = frozenset({'PERSON', 'LOCATION'})
+CAPITALIZED_PHRASE_LABELS = frozenset({'EVENT_NAME', 'EVENT'})
+
 class SchedyPipeline:
     """
     Main pipeline for processing text and creating calendar events
@@ -30,26 +45,56 @@ class SchedyPipeline:
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or {}
 
-        # Initialize components
-        self.text_processor = TextProcessor(
-            language=TEXT_PROCESSING_CONFIG['language']
-        )
+        # Text processing components (text_processor, intent_classifier, datetime_parser,
+        # ner_extractor) are created on first use, so calendar-only callers never load models
 
-        self.intent_classifier = IntentClassifier()
-        self.datetime_parser = DateTimeParser(
-            timezone=TEXT_PROCESSING_CONFIG['timezone']
-        )
-        self.ner_extractor = NERExtractor(
-            model_path=MODEL_CONFIG['ner_model']['model_path'],
-            language=MODEL_CONFIG['ner_model']['language']
-        )
+        # Cleaned text, intent and entities by input text. They don't depend on the
+        # current date, unlike the parsed date/time, so repeated texts skip the models
+        self._inference_cache: OrderedDict = OrderedDict()
 
         # Initialize Google Calendar client (optional)
         self.calendar_client = None
         self._init_calendar_client()
 
-        # Load trained models if available
-        self._load_models()
+    @cached_property
+    def text_processor(self) -> TextProcessor:
+        """Text processor, shared with the intent classifier and NER extractor"""
+        return get_text_processor(
+            language=TEXT_PROCESSING_CONFIG['language']
+        )
+
+    @cached_property
+    def intent_classifier(self) -> IntentClassifier:
+        """Intent classifier, loaded from the trained model on first access if available"""
+        intent_model_path = MODEL_CONFIG['intent_classifier']['model_path']
+        if os.path.exists(intent_model_path):
+            try:
+                intent_classifier = IntentClassifier.load(intent_model_path)
+                logger.info("Loaded intent classifier model")
+                return intent_classifier
+            except Exception as e:
+                logger.error(f"Error loading intent classifier: {e}")
+        else:
+            logger.warning("Intent classifier model not found. Using rule-based classification.")
+
+        return IntentClassifier()
+
+    @cached_property
+    def datetime_parser(self) -> DateTimeParser:
+        """Date/time parser, created on first access"""
+        return DateTimeParser(
+            timezone=TIMEZONE
+        )
+
+    @cached_property
+    def ner_extractor(self) -> NERExtractor:
+        """NER extractor, created on first access; loading the spaCy model is the slow part"""
+        return NERExtractor(
+            model_path=MODEL_CONFIG['ner_model']['model_path'],
+            language=MODEL_CONFIG['ner_model']['language'],
+            batch_size=MODEL_CONFIG['ner_model'].get('batch_size', 64),
+            use_gpu=MODEL_CONFIG['ner_model'].get('use_gpu', False)
+        )
 
     def _init_calendar_client(self):
         """Initialize Google Calendar client if credentials are available"""
@@ -70,19 +115,6 @@ class SchedyPipeline:
         except Exception as e:
             logger.error(f"Error initializing Google Calendar client: {e}")
 
-    def _load_models(self):
-        """Load trained models if available"""
-        # Load intent classifier
-        intent_model_path = MODEL_CONFIG['intent_classifier']['model_path']
-        if os.path.exists(intent_model_path):
-            try:
-                self.intent_classifier = IntentClassifier.load(intent_model_path)
-                logger.info("Loaded intent classifier model")
-            except Exception as e:
-                logger.error(f"Error loading intent classifier: {e}")
-        else:
-            logger.warning("Intent classifier model not found. Using rule-based classification.")
-
     def process_text(self, text: str) -> Dict[str, Any]:
         """
         Process input text and extract event information
@@ -93,51 +125,164 @@ class SchedyPipeline:
         Returns:
             Dict[str, Any]: Processed event information
         """
-        if not text or len(text.strip()) == 0:
-            return {'error': 'Empty input text'}
+        return self.process_texts([text])[0]
+
+    def process_texts(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Process several texts, classifying their intents and extracting their entities in batches
+
+        Args:
+            texts (List[str]): Input texts in Russian
+
+        Returns:
+            List[Dict[str, Any]]: Processed event information for each text, in input order
+        """
+        results = [None] * len(texts)
+        queued = []
+        inferences = {}
+        prepared = {}
 
-        # Limit text length
         max_length = TEXT_PROCESSING_CONFIG.get('max_text_length', 1000)
-        if len(text) > max_length:
-            text = text[:max_length]
-            logger.warning(f"Input text truncated to {max_length} characters")
+        for index, text in enumerate(texts):
+            if not text or len(text.strip()) == 0:
+                results[index] = {'error': 'Empty input text'}
+                continue
+
+            # Limit text length
+            if len(text) > max_length:
+                text = text[:max_length]
+                logger.warning(f"Input text truncated to {max_length} characters")
+
+            # Texts seen before are answered from the inference cache
+            inference = self._inference_cache.get(text)
+            if inference is not None:
+                self._inference_cache.move_to_end(text)
+                inferences[text] = inference
+                queued.append((index, text))
+                continue
+
+            # Repeated within this batch, inferred once
+            if text in prepared:
+                queued.append((index, text))
+                continue
 
-        try:
-            # Step 1: Clean and preprocess text
-            cleaned_text = self.text_processor.clean_and_preprocess_text(text)
-            logger.info(f"Processing text: {cleaned_text}")
+            try:
+                # Step 1: Clean and preprocess text
+                cleaned_text = self.text_processor.clean_and_preprocess_text(text)
+                logger.info(f"Processing text: {cleaned_text}")
+
+                # Intent classification needs lowercased and cleaned text
+                prepared[text] = (cleaned_text, self.text_processor.preprocess_for_classification(
+                    cleaned_text, already_cleaned=True
+                ))
+                queued.append((index, text))
+            except Exception as e:
+                logger.error(f"Error processing text: {e}")
+                results[index] = {
+                    'original_text': text,
+                    'error': str(e),
+                    'success': False
+                }
 
-            # Step 2: Parse date/time information FIRST
-            # This can help clean the text for the NER model
-            datetime_info = self.datetime_parser.parse_event(cleaned_text)
-            logger.info(f"Parsed datetime: {datetime_info}")
+        failures = {}
+        if prepared:
+            try:
+                inferences.update(self._infer(prepared))
+            except Exception as e:
+                # One bad text must not fail the whole batch: retry every text on its own
+                logger.error(f"Error processing batch, retrying texts one by one: {e}")
+                for text, item in prepared.items():
+                    try:
+                        inferences.update(self._infer({text: item}))
+                    except Exception as text_error:
+                        logger.error(f"Error processing text: {text_error}")
+                        failures[text] = text_error
+
+        # One clock reading for the whole batch, used for default event times
+        now = datetime.now()
+        for index, text in queued:
+            if text in failures:
+                results[index] = {
+                    'original_text': text,
+                    'error': str(failures[text]),
+                    'success': False
+                }
+                continue
+            results[index] = self._process_inferred_text(text, *inferences[text], now=now)
 
-            # Step 3: Classify intent
-            # Intent classification needs lowercased and cleaned text
-            text_for_classification = self.text_processor.preprocess_for_classification(cleaned_text)
-            intent = self.intent_classifier.predict(text_for_classification)
-            logger.info(f"Detected intent: {intent}")
+        return results
 
-            # Step 4: Extract entities from the original cleaned text.
-            # Do not remove parts of the text, as it confuses the model.
-            entities = self.ner_extractor.extract_entities(cleaned_text)
-            logger.info(f"Raw extracted entities: {entities}")
+    def _infer(self, prepared: Dict[str, tuple]) -> Dict[str, tuple]:
+        """
+        Classify intents and extract entities for new texts, and cache the results
+
+        Args:
+            prepared (Dict[str, tuple]): Cleaned text and classification text by input text
+
+        Returns:
+            Dict[str, tuple]: Cleaned text, intent, entities and processed entities by input text
+        """
+        cleaned_texts = [cleaned_text for cleaned_text, _ in prepared.values()]
 
+        # Step 3: Classify intent, for every text at once
+        intents = self.intent_classifier.predict_batch([item[1] for item in prepared.values()])
+
+        # Step 4: Extract entities from the original cleaned texts, for every text at once.
+        # Do not remove parts of the text, as it confuses the model.
+        entities_batch = self.ner_extractor.extract_entities_batch(cleaned_texts, already_cleaned=True)
+
+        inferences = {}
+        for text, cleaned_text, intent, entities in zip(prepared, cleaned_texts, intents, entities_batch):
             # Step 4.5: Post-process entities for normalization (lemmatize and capitalize)
             processed_entities = self._postprocess_entities(entities)
+
+            inference = (cleaned_text, intent, entities, processed_entities)
+            inferences[text] = inference
+            self._inference_cache[text] = inference
+
+        while len(self._inference_cache) > INFERENCE_CACHE_SIZE:
+            self._inference_cache.popitem(last=False)
+
+        return inferences
+
+    def _process_inferred_text(self, text: str, cleaned_text: str, intent: str,
+                               entities: Dict[str, str], processed_entities: Dict[str, str],
+                               now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Run the date-dependent steps that follow intent classification and entity extraction
+
+        Args:
+            text (str): Input text, truncated to the maximum length
+            cleaned_text (str): Cleaned input text
+            intent (str): Detected intent
+            entities (Dict[str, str]): Extracted entities
+            processed_entities (Dict[str, str]): Normalized entities
+            now (Optional[datetime]): Current time for default event times, read from the clock if omitted
+
+        Returns:
+            Dict[str, Any]: Processed event information
+        """
+        try:
+            # Step 2: Parse date/time information
+            datetime_info = self.datetime_parser.parse_event(cleaned_text)
+            logger.info(f"Parsed datetime: {datetime_info}")
+
+            logger.info(f"Detected intent: {intent}")
+            logger.info(f"Raw extracted entities: {entities}")
             logger.info(f"Processed entities: {processed_entities}")
 
             # Step 5: Build event data
             event_data = self._build_event_data(
-                intent, processed_entities, datetime_info, cleaned_text
+                intent, processed_entities, datetime_info, cleaned_text, now
             )
 
+            # Results get copies of the cached entities, so callers can't alter the cache
             return {
                 'original_text': text,
                 'cleaned_text': cleaned_text,
                 'intent': intent,
-                'entities': entities,
-                'processed_entities': processed_entities,
+                'entities': dict(entities),
+                'processed_entities': dict(processed_entities),
                 'datetime_info': datetime_info,
                 'event_data': event_data,
                 'success': True
@@ -152,7 +297,8 @@ class SchedyPipeline:
             }
 
     def _build_event_data(self, intent: str, entities: Dict[str, str], 
-                         datetime_info: Dict[str, Any], text: str) -> Optional[Dict[str, Any]]:
+                         datetime_info: Dict[str, Any], text: str,
+                         now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
         """
         Build Google Calendar event data from extracted information
 
@@ -161,6 +307,7 @@ class SchedyPipeline:
             entities (Dict[str, str]): Extracted entities
             datetime_info (Dict[str, Any]): Parsed datetime information
             text (str): Original text
+            now (Optional[datetime]): Current time for default event times, read from the clock if omitted
 
         Returns:
             Optional[Dict[str, Any]]: Google Calendar event data
@@ -169,62 +316,63 @@ class SchedyPipeline:
             return None
 
         try:
-            # Start with default template
-            event_data = DEFAULT_EVENT_TEMPLATE.copy()
-
             # Set event summary
             if 'EVENT_NAME' in entities:
-                event_data['summary'] = entities['EVENT_NAME']
+                summary = entities['EVENT_NAME']
             elif 'EVENT' in entities:
-                event_data['summary'] = entities['EVENT']
+                summary = entities['EVENT']
             elif 'PERSON' in entities:
-                event_data['summary'] = f"Встреча с {entities['PERSON']}"
+                summary = f"Встреча с {entities['PERSON']}"
             else:
-                event_data['summary'] = "Новое событие"
-
-            # Set description
-            event_data['description'] = f"Создано из текста: {text}"
-
-            # Set location
-            if 'LOCATION' in entities:
-                event_data['location'] = entities['LOCATION']
-
-            # Set attendees
-            if 'PERSON' in entities:
-                # Note: This would need email mapping in a real system
-                event_data['attendees'] = []
+                summary = "Новое событие"
 
             # Set date/time
             if datetime_info.get('start') and datetime_info.get('end'):
-                event_data['start'] = {
+                start = {
                     'dateTime': datetime_info['start'].isoformat(),
-                    'timeZone': TEXT_PROCESSING_CONFIG['timezone']
+                    'timeZone': TIMEZONE
                 }
-                event_data['end'] = {
+                end = {
                     'dateTime': datetime_info['end'].isoformat(),
-                    'timeZone': TEXT_PROCESSING_CONFIG['timezone']
+                    'timeZone': TIMEZONE
                 }
             elif datetime_info.get('date'):
                 # All day event
                 date_str = datetime_info['date'].isoformat()
-                event_data['start'] = {'date': date_str}
-                event_data['end'] = {'date': date_str}
+                start = {'date': date_str}
+                end = {'date': date_str}
             else:
                 # Default to tomorrow at 10:00
-                tomorrow = datetime.now() + timedelta(days=1)
+                tomorrow = (now or datetime.now()) + timedelta(days=1)
                 start_time = tomorrow.replace(hour=10, minute=0, second=0, microsecond=0)
                 end_time = start_time + timedelta(hours=1)
 
-                event_data['start'] = {
+                start = {
                     'dateTime': start_time.isoformat(),
-                    'timeZone': TEXT_PROCESSING_CONFIG['timezone']
+                    'timeZone': TIMEZONE
                 }
-                event_data['end'] = {
+                end = {
                     'dateTime': end_time.isoformat(),
-                    'timeZone': TEXT_PROCESSING_CONFIG['timezone']
+                    'timeZone': TIMEZONE
                 }
 
-            return event_data
+            # Fields not taken from the text come from the default template; its nested
+            # reminders are rebuilt so events never share (and mutate) the template's objects
+            reminders = DEFAULT_EVENT_TEMPLATE['reminders']
+            return {
+                'summary': summary,
+                'start': start,
+                'end': end,
+                'description': f"Создано из текста: {text}",
+                'location': entities.get('LOCATION', DEFAULT_EVENT_TEMPLATE['location']),
+                'colorId': DEFAULT_EVENT_TEMPLATE['colorId'],
+                # Note: Attendees would need email mapping in a real system
+                'attendees': [],
+                'reminders': {
+                    'useDefault': reminders['useDefault'],
+                    'overrides': [dict(override) for override in reminders['overrides']]
+                }
+            }
 
         except Exception as e:
             logger.error(f"Error building event data: {e}")
@@ -234,22 +382,21 @@ class SchedyPipeline:
         """
         Lemmatize and capitalize extracted entities for correct representation.
         """
+        lemmatize = self.text_processor.lemmatize
+
         processed_entities = {}
         for label, text in entities.items():
-            # Lemmatize each word in the entity text to get its base form
-            words = text.split()
-            lemmatized_words = [self.text_processor.lemmatize(word) for word in words]
-            
-            # Capitalize appropriately
-            if label in ['PERSON', 'LOCATION']:
+            # Lemmatize each word in the entity text to get its base form,
+            # and capitalize appropriately in the same pass
+            if label in CAPITALIZED_WORD_LABELS:
                 # For people and places, capitalize each word.
-                processed_text = ' '.join(word.capitalize() for word in lemmatized_words)
-            elif label in ['EVENT_NAME', 'EVENT']:
-                # For event titles, capitalize the first word of the phrase.
-                processed_text = ' '.join(lemmatized_words).capitalize()
+                processed_text = ' '.join([lemmatize(word).capitalize() for word in text.split()])
             else:
-                processed_text = ' '.join(lemmatized_words)
-            
+                processed_text = ' '.join([lemmatize(word) for word in text.split()])
+                if label in CAPITALIZED_PHRASE_LABELS:
+                    # For event titles, capitalize the first word of the phrase.
+                    processed_text = processed_text.capitalize()
+
             processed_entities[label] = processed_text
         return processed_entities
 
@@ -270,7 +417,7 @@ class SchedyPipeline:
         try:
             event_id = self.calendar_client.create_event(
                 event_data, 
-                calendar_id=GOOGLE_CALENDAR_CONFIG['calendar_id']
+                calendar_id=CALENDAR_ID
             )
             return event_id
         except Exception as e:
@@ -289,7 +436,30 @@ class SchedyPipeline:
         """
         # Process text
         result = self.process_text(text)
+        return self.create_event_from_result(result)
 
+    def process_and_create_events(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Process several texts and create their calendar events
+
+        Args:
+            texts (List[str]): Input texts
+
+        Returns:
+            List[Dict[str, Any]]: Processing results with event creation status
+        """
+        return [self.create_event_from_result(result) for result in self.process_texts(texts)]
+
+    def create_event_from_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create the calendar event for an already processed text, without processing it again
+
+        Args:
+            result (Dict[str, Any]): Result of process_text
+
+        Returns:
+            Dict[str, Any]: The same result with event creation status
+        """
         if not result.get('success'):
             return result
 
@@ -339,7 +509,7 @@ class SchedyPipeline:
             time_max = time_min + timedelta(days=days)
 
             events = self.calendar_client.get_events(
-                calendar_id=GOOGLE_CALENDAR_CONFIG['calendar_id'],
+                calendar_id=CALENDAR_ID,
                 time_min=time_min,
                 time_max=time_max,
                 max_results=50
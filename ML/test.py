@@ -5,7 +5,15 @@ Test script for Schedy ML Pipeline
 
 import sys
 import os
+import io
 import json
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from typing import Callable, Tuple
+from unittest.mock import MagicMock
 
 # Add current directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -30,10 +38,10 @@ def test_text_processing():
         "Привет, как дела?"  # Should be UNKNOWN
     ]
 
-    results = []
-    for test_text in test_cases:
+    # Process all test cases in one batch, so the models run over them together
+    results = pipeline.process_texts(test_cases)
+    for test_text, result in zip(test_cases, results):
         print(f"\nProcessing: {test_text}")
-        result = pipeline.process_text(test_text)
 
         if result.get('success'):
             print(f"  Intent: {result.get('intent')}")
@@ -45,8 +53,6 @@ def test_text_processing():
         else:
             print(f"  Error: {result.get('error')}")
 
-        results.append(result)
-
     return results
 
 
@@ -82,6 +88,33 @@ def test_intent_classification():
         return False
 
 
+def test_bulk_preprocessing():
+    """Test preprocessing a column large enough to go to worker processes"""
+    print("\n=== Testing Bulk Preprocessing ===")
+
+    try:
+        from intent_classifier import IntentClassifier, PARALLEL_PREPROCESS_MIN_SIZE
+
+        classifier = IntentClassifier()
+        sample_texts = create_sample_training_data()['text'].tolist()
+        texts = (sample_texts * (PARALLEL_PREPROCESS_MIN_SIZE // len(sample_texts) + 1))[:PARALLEL_PREPROCESS_MIN_SIZE]
+
+        processed = classifier._bulk_preprocess(texts)
+        expected = [classifier.text_processor.preprocess_for_classification(text) for text in texts]
+
+        if processed != expected:
+            print("✗ Bulk preprocessing differs from preprocessing text by text")
+            return False
+
+        print(f"  Preprocessed {len(processed)} texts")
+        print("✓ Bulk preprocessing test passed")
+        return True
+
+    except Exception as e:
+        print(f"✗ Bulk preprocessing test failed: {e}")
+        return False
+
+
 def test_datetime_parsing():
     """Test datetime parsing"""
     print("\n=== Testing DateTime Parsing ===")
@@ -103,6 +136,22 @@ def test_datetime_parsing():
             parsed = parser.parse_event(text)
             print(f"  '{text}' -> Date: {parsed.get('date')}, Start: {parsed.get('start')}")
 
+        # Several keywords of one kind: the fixed priority wins, not the text order
+        today = date.today()
+        assert parser.parse_date("вчера или завтра") == today + timedelta(days=1)
+        assert parser.parse_date("послезавтра, а не сегодня") == today
+        assert parser.parse_date("пятницу или понедельник").weekday() == 0
+        assert parser.parse_recurrence("еженедельно каждый день") == 'RRULE:FREQ=DAILY'
+        assert parser.parse_event("ежегодно и ежемесячно")['recurrence'] == 'RRULE:FREQ=MONTHLY'
+
+        # Inflected weekday names resolve like the base form; abbreviations stay whole words
+        assert parser.parse_date("встреча до четверга").weekday() == 3
+        assert parser.parse_date("созвон к понедельнику").weekday() == 0
+        assert parser.parse_date("ко вторнику").weekday() == 1
+        parsed = parser.parse_event("по вторникам в 10:00")
+        assert parsed['date'].weekday() == 1 and parsed['start'].strftime('%H:%M') == '10:00'
+        assert parser.parse_date("встреча в вс").weekday() == 6
+
         print("✓ DateTime parsing test passed")
         return True
 
@@ -111,6 +160,73 @@ def test_datetime_parsing():
         return False
 
 
+def test_events_cache_copies():
+    """Test that events returned from the cache can be edited safely"""
+    print("\n=== Testing Events Cache ===")
+
+    try:
+        from calendar_client import GoogleCalendarClient
+
+        # Skip authentication; only the cache is exercised
+        client = GoogleCalendarClient.__new__(GoogleCalendarClient)
+        client._events_cache = OrderedDict()
+        client._events_cache_lock = threading.Lock()
+        client._events_refreshing = set()
+        client._execute = lambda request, http=None: {
+            'items': [{'id': 'e1', 'summary': 'Встреча', 'start': {'dateTime': '2024-06-12T10:00:00+03:00'}}]
+        }
+        client.service = MagicMock()
+
+        events = client.get_events()
+        events[0]['summary'] = 'Изменено'
+        events[0]['start']['dateTime'] = '2024-06-12T12:00:00+03:00'
+
+        cached = client.get_events()
+        if client.service.events.return_value.list.call_count != 1:
+            print("✗ Second call did not come from the cache")
+            return False
+        if cached[0]['summary'] != 'Встреча' or cached[0]['start']['dateTime'] != '2024-06-12T10:00:00+03:00':
+            print(f"✗ Cached event was changed through a returned event: {cached[0]}")
+            return False
+
+        print("✓ Events cache test passed")
+        return True
+
+    except Exception as e:
+        print(f"✗ Events cache test failed: {e}")
+        return False
+
+
+def test_bulk_event_timezones():
+    """Test that bulk-built events convert aware datetimes to the event timezone"""
+    print("\n=== Testing Bulk Event Timezones ===")
+
+    try:
+        from calendar_client import EventBuilder
+
+        # 10:00 at UTC+5 is 08:00 in Moscow (UTC+3)
+        start = datetime(2024, 6, 12, 10, 0, tzinfo=dt_timezone(timedelta(hours=5)))
+        events = EventBuilder.build_events_bulk(
+            ['Встреча', 'Обед'],
+            [start, datetime(2024, 6, 12, 13, 0)],
+            [start + timedelta(hours=1), datetime(2024, 6, 12, 14, 0)],
+            timezone='Europe/Moscow'
+        )
+
+        expected = [('2024-06-12T08:00:00', '2024-06-12T09:00:00'), ('2024-06-12T13:00:00', '2024-06-12T14:00:00')]
+        actual = [(event['start']['dateTime'], event['end']['dateTime']) for event in events]
+        if actual != expected:
+            print(f"✗ Unexpected event times: {actual}")
+            return False
+
+        print("✓ Bulk event timezone test passed")
+        return True
+
+    except Exception as e:
+        print(f"✗ Bulk event timezone test failed: {e}")
+        return False
+
+
 def test_ner():
     """Test Named Entity Recognition"""
     print("\n=== Testing Named Entity Recognition ===")
@@ -127,8 +243,7 @@ def test_ner():
             "Обед с Анной в ресторане"
         ]
 
-        for text in test_texts:
-            entities = ner.extract_entities(text)
+        for text, entities in zip(test_texts, ner.extract_entities_batch(test_texts)):
             print(f"  '{text}' -> {entities}")
 
         print("✓ NER test passed")
@@ -139,32 +254,57 @@ def test_ner():
         return False
 
 
+def run_captured(test: Callable) -> Tuple[bool, str]:
+    """
+    Run one test, capturing what it prints so parallel tests don't interleave
+
+    Args:
+        test (Callable): Test function; it fails by returning False or raising
+
+    Returns:
+        Tuple[bool, str]: Whether the test passed, and its printed output
+    """
+    output = io.StringIO()
+    with redirect_stdout(output):
+        try:
+            passed = test() is not False
+        except Exception as e:
+            print(f"\n✗ Test {test.__name__} failed: {e}")
+            passed = False
+
+    return passed, output.getvalue()
+
+
 def main():
     """Run all tests"""
     print("=== Schedy ML Pipeline Tests ===\n")
 
-    tests_passed = 0
-    total_tests = 4
+    tests = [
+        test_text_processing,
+        test_intent_classification,
+        test_bulk_preprocessing,
+        test_datetime_parsing,
+        test_events_cache_copies,
+        test_bulk_event_timezones,
+        test_ner
+    ]
+    total_tests = len(tests)
 
-    # Test 1: Basic text processing
-    try:
-        test_text_processing()
-        tests_passed += 1
-        print("\n✓ Text processing test passed")
-    except Exception as e:
-        print(f"\n✗ Text processing test failed: {e}")
+    # The tests are independent and each loads its own models, so they run in
+    # separate processes; their output is printed afterwards in the usual order
+    with ProcessPoolExecutor(max_workers=total_tests) as executor:
+        futures = [executor.submit(run_captured, test) for test in tests]
 
-    # Test 2: Intent classification
-    if test_intent_classification():
-        tests_passed += 1
+        tests_passed = 0
+        for test, future in zip(tests, futures):
+            passed, output = future.result()
+            print(output, end='')
 
-    # Test 3: DateTime parsing
-    if test_datetime_parsing():
-        tests_passed += 1
+            if test is test_text_processing and passed:
+                print("\n✓ Text processing test passed")
 
-    # Test 4: NER
-    if test_ner():
-        tests_passed += 1
+            if passed:
+                tests_passed += 1
 
     print(f"\n=== Test Results ===")
     print(f"Passed: {tests_passed}/{total_tests}")
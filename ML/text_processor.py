@@ -6,11 +6,90 @@ Handles cleaning, preprocessing, and sentence splitting
 import re
 import spacy
 import pymorphy3
+from functools import cached_property, lru_cache
 from typing import List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Cleaning patterns, compiled once for every processor
+WHITESPACE_RE = re.compile(r'\s+')
+REPEATED_PUNCTUATION_RE = re.compile(r'([.!?])\1+')
+SENTENCE_END_RE = re.compile(r'[.!?]')
+WORD_RE = re.compile(r'\w+')
+PERSON_PREFIX_RE = re.compile(r'^(с|со)\s+', re.IGNORECASE)
+EVENT_PREFIX_RE = re.compile(r'^(на|в|о|про)\s+', re.IGNORECASE)
+
+# Characters that end a sentence for the rule-based sentencizer
+SENTENCE_PUNCT_CHARS = [".", "!", "?", "…"]
+
+# Pipeline components part-of-speech tags depend on; remove_prepositions skips
+# the parser, lemmatizer and ner of the loaded model
+POS_PIPES = frozenset({"tok2vec", "tagger", "morphologizer", "attribute_ruler"})
+
+# Number of texts spaCy packs together in split_into_sentences_batch
+SENTENCE_BATCH_SIZE = 64
+
+# Number of distinct words whose lemmas are kept; bounded so that a stream of
+# unique words can't grow the cache without limit
+LEMMA_CACHE_SIZE = 200_000
+
+# Function words that are their own lemma, so lemmatize returns them without
+# a dictionary lookup; only lowercase spellings are listed
+LEMMA_STOPWORDS = frozenset({
+    'а', 'без', 'бы', 'в', 'ведь', 'вот', 'где', 'да', 'даже', 'для', 'до', 'же',
+    'за', 'зачем', 'и', 'из', 'или', 'к', 'как', 'когда', 'кто', 'куда', 'ли',
+    'между', 'на', 'над', 'не', 'нет', 'ни', 'но', 'ну', 'о', 'от', 'перед', 'по',
+    'под', 'после', 'потом', 'потому', 'при', 'про', 'с', 'сейчас', 'так', 'там',
+    'тогда', 'то', 'тоже', 'только', 'тут', 'у', 'уже', 'хоть', 'чем', 'через',
+    'что', 'чтобы',
+})
+
+
+@lru_cache(maxsize=1)
+def _get_morph() -> pymorphy3.MorphAnalyzer:
+    """
+    Load the pymorphy3 analyzer once per process
+
+    Returns:
+        pymorphy3.MorphAnalyzer: Analyzer shared by every TextProcessor
+    """
+    return pymorphy3.MorphAnalyzer()
+
+
+@lru_cache(maxsize=None)
+def _get_nlp_sent(language: str) -> spacy.language.Language:
+    """
+    Build the rule-based sentence splitter once per language
+
+    Args:
+        language (str): Language code of the blank model
+
+    Returns:
+        spacy.language.Language: Blank model with only a sentencizer
+    """
+    # Punctuation-based boundaries are enough for chat messages, and a byte scan
+    # is far cheaper than running the full model's tagger and parser
+    nlp = spacy.blank(language)
+    nlp.add_pipe("sentencizer", config={"punct_chars": SENTENCE_PUNCT_CHARS})
+    return nlp
+
+
+@lru_cache(maxsize=1)
+def _get_nlp_full() -> Optional[spacy.language.Language]:
+    """
+    Load the full Russian spaCy model once per process
+
+    Returns:
+        Optional[spacy.language.Language]: The model, or None if it is not installed
+    """
+    try:
+        return spacy.load("ru_core_news_sm")
+    except OSError:
+        logger.warning("Russian spaCy model not found. Part-of-speech tagging is unavailable.")
+        return None
+
+
 class TextProcessor:
     """
     Russian text processor with cleaning and preprocessing capabilities
@@ -18,16 +97,25 @@ class TextProcessor:
 
     def __init__(self, language: str = 'ru'):
         self.language = language
-        self.morph = pymorphy3.MorphAnalyzer()
+        # The pymorphy3 dictionaries and the spaCy model are loaded once per
+        # process and shared, so extra processors cost next to nothing
+        self.morph = _get_morph()
 
-        # Initialize spaCy models
-        try:
-            self.nlp_sent = spacy.load("ru_core_news_sm")
-        except OSError:
-            logger.warning("Russian spaCy model not found. Using blank model for sentence splitting.")
-            self.nlp_sent = spacy.blank(language)
-            # Add basic sentence segmentation
-            self.nlp_sent.add_pipe("sentencizer")
+        # Entities repeat the same names and words, and each pymorphy3 analysis
+        # costs tens of microseconds, so lemmas are memoized per instance
+        self._lemma_cache = lru_cache(maxsize=LEMMA_CACHE_SIZE)(self._lemmatize_uncached)
+
+        self.nlp_sent = _get_nlp_sent(language)
+
+    @cached_property
+    def nlp_full(self) -> Optional[spacy.language.Language]:
+        """Full spaCy model for part-of-speech tags, loaded on first access"""
+        return _get_nlp_full()
+
+    @cached_property
+    def _pos_disable(self) -> List[str]:
+        """Components of the full model to turn off when only POS tags are needed"""
+        return [name for name in self.nlp_full.pipe_names if name not in POS_PIPES]
 
     def clean_and_preprocess_text(self, text: str) -> str:
         """
@@ -43,14 +131,11 @@ class TextProcessor:
             return ""
 
         # Basic cleaning
-        text = re.sub(r'\n+', ' ', text)  # Replace newlines with spaces
-        text = re.sub(r'\s+', ' ', text)  # Replace multiple spaces with single space
+        text = WHITESPACE_RE.sub(' ', text)  # Replace newlines and runs of spaces with single space
         text = text.strip()
 
         # Remove extra punctuation
-        text = re.sub(r'[.]{2,}', '.', text)  # Multiple dots to single dot
-        text = re.sub(r'[!]{2,}', '!', text)  # Multiple exclamations to single
-        text = re.sub(r'[?]{2,}', '?', text)  # Multiple questions to single
+        text = REPEATED_PUNCTUATION_RE.sub(r'\1', text)  # Multiple dots, exclamations or questions to single
 
         return text
 
@@ -74,9 +159,91 @@ class TextProcessor:
         except Exception as e:
             logger.error(f"Error splitting sentences: {e}")
             # Fallback to simple splitting
-            return [s.strip() for s in re.split(r'[.!?]', text) if s.strip()]
+            return [s.strip() for s in SENTENCE_END_RE.split(text) if s.strip()]
+
+    def split_into_sentences_batch(self, texts: List[str]) -> List[List[str]]:
+        """
+        Split several texts into sentences, running spaCy over them in batches
+
+        Args:
+            texts (List[str]): Input texts to split
+
+        Returns:
+            List[List[str]]: List of sentences for each text, in input order
+        """
+        results: List[List[str]] = [[] for _ in texts]
+
+        # Empty texts have no sentences and are not sent to the model
+        indices = [index for index, text in enumerate(texts) if text]
+        if not indices:
+            return results
+
+        try:
+            docs = self.nlp_sent.pipe(
+                [texts[index] for index in indices],
+                batch_size=SENTENCE_BATCH_SIZE,
+                n_process=1
+            )
+            for index, doc in zip(indices, docs):
+                results[index] = [sent.text.strip() for sent in doc.sents if sent.text.strip()]
+
+            return results
+
+        except Exception as e:
+            logger.error(f"Error splitting sentences in batch: {e}")
+            return [self.split_into_sentences(text) for text in texts]
 
     def lemmatize(self, word: str) -> str:
+        """
+        Lemmatize a Russian word using pymorphy3, reusing earlier results for repeated words
+
+        Args:
+            word (str): Word to lemmatize
+
+        Returns:
+            str: Lemmatized form of the word
+        """
+        if word in LEMMA_STOPWORDS:
+            return word
+        # pymorphy3 only lowercases words without Cyrillic letters (Latin, numbers)
+        if word.isascii():
+            return word.lower()
+        return self._lemma_cache(word)
+
+    def lemmatize_many(self, words: List[str]) -> List[str]:
+        """
+        Lemmatize a sequence of words, looking up each distinct word once
+
+        Args:
+            words (List[str]): Words to lemmatize
+
+        Returns:
+            List[str]: Lemmatized forms in the same order
+        """
+        # Repeats within one call are answered from a local dict without
+        # going through the stop-word checks and the LRU cache again
+        seen = {}
+        lemmas = []
+        for word in words:
+            lemma = seen.get(word)
+            if lemma is None:
+                lemma = seen[word] = self.lemmatize(word)
+            lemmas.append(lemma)
+        return lemmas
+
+    def lemmatize_text(self, text: str) -> str:
+        """
+        Lemmatize every word of a text, dropping punctuation
+
+        Args:
+            text (str): Input text
+
+        Returns:
+            str: Space-separated lemmas
+        """
+        return ' '.join(self.lemmatize_many(WORD_RE.findall(text)))
+
+    def _lemmatize_uncached(self, word: str) -> str:
         """
         Lemmatize a Russian word using pymorphy3
 
@@ -117,16 +284,19 @@ class TextProcessor:
         # Specific cleaning based on entity type
         if label == 'PERSON':
             # Remove common prefixes/suffixes for person names
-            text = re.sub(r'^(с|со)\s+', '', text, flags=re.IGNORECASE)
-            text = text.title()  # Capitalize names
+            text = PERSON_PREFIX_RE.sub('', text)
+            # Capitalize names; istitle() scans without allocating, and names that
+            # already come title-cased (the usual ASR output) are kept as they are
+            if not text.istitle():
+                text = text.title()
 
         elif label in ['TIME', 'DATE']:
             # Clean time/date entities
-            text = re.sub(r'\s+', ' ', text)
+            text = WHITESPACE_RE.sub(' ', text)
 
         elif label == 'EVENT':
             # Clean event names
-            text = re.sub(r'^(на|в|о|про)\s+', '', text, flags=re.IGNORECASE)
+            text = EVENT_PREFIX_RE.sub('', text)
 
         return text.strip()
 
@@ -142,9 +312,14 @@ class TextProcessor:
         """
         if not text:
             return ""
-        
+
+        # Without the full model there are no POS tags, so nothing is recognised
+        if self.nlp_full is None:
+            return text
+
         try:
-            doc = self.nlp_sent(text)
+            with self.nlp_full.select_pipes(disable=self._pos_disable):
+                doc = self.nlp_full(text)
             # Reconstruct the text, keeping tokens that are not prepositions (ADP - Adposition)
             # token.text_with_ws preserves the trailing whitespace.
             tokens_without_prepositions = [token.text_with_ws for token in doc if token.pos_ != 'ADP']
@@ -154,23 +329,39 @@ class TextProcessor:
             logger.error(f"Error removing prepositions: {e}")
             return text
 
-    def preprocess_for_classification(self, text: str) -> str:
+    def preprocess_for_classification(self, text: str, already_cleaned: bool = False) -> str:
         """
         Preprocess text specifically for intent classification
 
         Args:
             text (str): Input text
+            already_cleaned (bool): Whether text is already the output of clean_and_preprocess_text
 
         Returns:
             str: Preprocessed text ready for classification
         """
-        text = self.clean_and_preprocess_text(text)
+        if not already_cleaned and (not text or not isinstance(text, str)):
+            return ""
 
-        # Convert to lowercase for classification
-        text = text.lower()
+        # Lowercase, then keep only the word runs: dropping punctuation and collapsing
+        # whitespace in one scan subsumes clean_and_preprocess_text's passes as well
+        return ' '.join(WORD_RE.findall(text.lower()))
 
-        # Remove punctuation for classification
-        text = re.sub(r'[^\w\s]', ' ', text)
-        text = re.sub(r'\s+', ' ', text).strip()
 
-        return text
+@lru_cache(maxsize=None)
+def _get_text_processor(language: str) -> TextProcessor:
+    return TextProcessor(language)
+
+
+def get_text_processor(language: str = 'ru') -> TextProcessor:
+    """
+    Get the process-wide text processor for a language
+
+    Args:
+        language (str): Language code
+
+    Returns:
+        TextProcessor: Processor shared by the pipeline, intent classifier and NER extractor
+    """
+    # Passed positionally so that every call style maps to the same cache entry
+    return _get_text_processor(language)
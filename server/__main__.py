@@ -1,23 +1,26 @@
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 import uvicorn
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 from api import setup_routers as setup_api_routers
 from config_reader import app, config, ROOT_DIR
-from api.voice import router as voice_router
 
 
 
+# Сжимаем только ответы от 1 КиБ: мелкие JSON сжатие не окупают
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+# Запросы с initData приходят только из нашего WebApp, поэтому
+# разрешаем ровно его origin, методы API и заголовки клиента
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=[config.WEBAPP_URL],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["initData", "X-Tg-Init-Data", "Content-Type"],
 )
 
 app.include_router(setup_api_routers())
-app.include_router(voice_router)
 @app.get("/", response_class=FileResponse)
 async def read_root():
     return str(ROOT_DIR / "templates" / "index.html")
@@ -26,4 +29,6 @@ if __name__ == "__main__":
     print(f"Starting server at http://{config.APP_HOST}:{config.APP_PORT}")
     print(f"Webapp URL: {config.WEBAPP_URL}")
     print(f"Google Redirect URI: {config.GOOGLE_REDIRECT_URI}")
-    uvicorn.run(app, host="0.0.0.0", port=config.APP_PORT)
\ No newline at end of file
+    # uvicorn[standard] ставит httptools и (кроме Windows) uvloop;
+    # "auto" сам выберет их там, где они установлены
+    uvicorn.run(app, host=config.APP_HOST, port=config.APP_PORT, loop="auto", http="auto")
\ No newline at end of file
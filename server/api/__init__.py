@@ -1,19 +1,16 @@
-from fastapi import APIRouter 
-from . import google
+from fastapi import APIRouter
 
-
-from . import common, users, layers, google
+from . import common, users, layers, google, voice
 
 
 def setup_routers() -> APIRouter:
-    router = APIRouter(prefix="/api")
-
-    router.include_router(google.router, prefix="/google", tags=["Google"])
+    # Роутеры сами задают префикс /api/..., кроме google — его монтируем здесь
     router = APIRouter()
+
     router.include_router(common.router)
     router.include_router(users.router)
     router.include_router(layers.router)
-    router.include_router(google.router)
+    router.include_router(voice.router)
+    router.include_router(google.router, prefix="/api/google", tags=["Google"])
 
     return router
-    
\ No newline at end of file
@@ -1,10 +1,8 @@
-from urllib.parse import parse_qsl
-import hmac, hashlib, json
 from typing import TypedDict, Any
 
 from fastapi import Request, HTTPException, status, Depends
 from pydantic import BaseModel
-from config_reader import config   # BOT_TOKEN берём оттуда
+from utils.tg_signature import verify_init_data
 
 
 class TelegramUser(BaseModel):
@@ -23,30 +21,10 @@ class WebAppInitData(BaseModel):
     hash: str
 
 
-def _check_signature(token: str, init_data: str) -> WebAppInitData:
-    """
-    Проверка подписи initData по официальной инструкции Telegram:
-    https://core.telegram.org/bots/webapps#validating-data-received-via-the-web-app
-    """
-    parsed = dict(parse_qsl(init_data, strict_parsing=True))
-    received_hash = parsed.pop("hash", "")
-    data_check_string = '\n'.join(f"{k}={v}" for k, v in sorted(parsed.items()))
-    secret_key = hmac.new(
-        key=bytes("WebAppData", "utf-8"),
-        msg=bytes(token, "utf-8"),
-        digestmod=hashlib.sha256,
-    ).digest()
-    calculated_hash = hmac.new(
-        key=secret_key,
-        msg=bytes(data_check_string, "utf-8"),
-        digestmod=hashlib.sha256,
-    ).hexdigest()
-
-    if not hmac.compare_digest(calculated_hash, received_hash):
-        raise ValueError("bad signature")
-
-    # Pydantic валидирует и превращает строковые значения в числа/объекты
-    return WebAppInitData(**parsed, hash=received_hash)
+def _check_signature(init_data: str) -> WebAppInitData:
+    # Подпись проверяет общий verify_init_data, здесь только валидация Pydantic,
+    # которая превращает строковые значения в числа/объекты
+    return WebAppInitData(**verify_init_data(init_data))
 
 
 async def auth(request: Request) -> WebAppInitData:
@@ -63,7 +41,7 @@ async def auth(request: Request) -> WebAppInitData:
             detail={"error": "Unauthorized"},
         )
     try:
-        return _check_signature(config.BOT_TOKEN, init_data)
+        return _check_signature(init_data)
     except ValueError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
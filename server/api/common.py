@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Request, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from aiogram.types import LabeledPrice, Update
 from aiogram.methods import CreateInvoiceLink
@@ -17,8 +17,8 @@ async def webhook(request: Request) -> None:
     await dp.feed_update(bot, update)
 
 
-@router.post("/api/donate", response_class=JSONResponse)
-async def donate(request: Request, auth_data: WebAppInitData = Depends(auth)) -> JSONResponse:
+@router.post("/api/donate", response_class=ORJSONResponse)
+async def donate(request: Request, auth_data: WebAppInitData = Depends(auth)) -> ORJSONResponse:
     data = await request.json()
     invoice_link = await bot(
         CreateInvoiceLink(
@@ -30,4 +30,4 @@ async def donate(request: Request, auth_data: WebAppInitData = Depends(auth)) ->
         )
     )
     
-    return JSONResponse({"invoice_link": invoice_link})
\ No newline at end of file
+    return ORJSONResponse({"invoice_link": invoice_link})
\ No newline at end of file
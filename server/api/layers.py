@@ -1,6 +1,6 @@
 from enum import Enum, auto
 from fastapi import APIRouter, Depends, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from aiogram.utils.web_app import WebAppInitData
 
 from .utils import auth, check_user
@@ -26,6 +26,6 @@ async def set_layer(
     # user.current_layer = layer_name.value
     # await user.save()
 
-    return JSONResponse(
+    return ORJSONResponse(
         {"status": "ok", "layer": layer_name.value}
     ) 
\ No newline at end of file
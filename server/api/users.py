@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Request, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from aiogram.utils.web_app import WebAppInitData
 
@@ -10,10 +10,10 @@ from .utils import auth, check_user
 router = APIRouter(prefix="/api/users", dependencies=[Depends(auth)])
 
 @router.get("/get")
-async def get_user(request: Request, auth_data: WebAppInitData = Depends(auth)) -> JSONResponse:
+async def get_user(request: Request, auth_data: WebAppInitData = Depends(auth)) -> ORJSONResponse:
     user = await check_user(auth_data.user.id)
     user_obj = (
         await UserSchema.from_tortoise_orm(user)
     ).model_dump(mode="json")
 
-    return JSONResponse({"user": user_obj})
+    return ORJSONResponse({"user": user_obj})
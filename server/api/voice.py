@@ -1,13 +1,67 @@
-from pathlib import Path
-from fastapi import APIRouter, HTTPException, status
+import asyncio
+import logging
+import os
+from datetime import datetime
+from fastapi import APIRouter, HTTPException, Request, status
 from fastapi.responses import Response
 
+from config_reader import VOICE_FILE, VOICE_FILE_MAX_SIZE, open_voice_file
+
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/voice", tags=["Voice"])
 
-VOICE_FILE = Path(__file__).resolve().parent.parent / "voice.txt"
+# Записи в общий дескриптор идут по одной, чтобы сообщения не перемешивались
+_voice_lock = asyncio.Lock()
+
+
+def _rotate_voice_file(fd: int) -> int:
+    """
+    Переименовывает заполненный voice.txt в voice.txt.<timestamp>
+    и возвращает дескриптор нового пустого файла.
+    Старый дескриптор закрывается только когда новый уже открыт; если ротация
+    не удалась, возвращается он же, и запись продолжается в прежний файл.
+    """
+    archive = VOICE_FILE.with_name(f"{VOICE_FILE.name}.{datetime.now():%Y%m%d-%H%M%S-%f}")
+    try:
+        os.replace(VOICE_FILE, archive)
+    except FileNotFoundError:
+        # Прошлая ротация уже убрала voice.txt, но не смогла открыть новый
+        pass
+    except PermissionError:
+        # Windows не даёт переименовать открытый файл: закрываем, переименовываем
+        # и открываем voice.txt заново (новый или, если не вышло, прежний)
+        os.close(fd)
+        try:
+            os.replace(VOICE_FILE, archive)
+        except OSError as e:
+            logger.error(f"Error rotating voice.txt: {e}")
+        try:
+            return open_voice_file()
+        except OSError as e:
+            # -1 вместо закрытого номера: он мог уже достаться другому файлу
+            logger.error(f"Error reopening voice.txt: {e}")
+            return -1
+    except OSError as e:
+        logger.error(f"Error rotating voice.txt: {e}")
+        return fd
+
+    try:
+        new_fd = open_voice_file()
+    except OSError as e:
+        # Старый дескриптор указывает на архив, пишем туда до следующей попытки
+        logger.error(f"Error opening new voice.txt: {e}")
+        return fd
+    os.close(fd)
+    return new_fd
+
+
+def _voice_file_size(fd: int) -> int:
+    return os.fstat(fd).st_size if fd >= 0 else 0
+
 
 @router.post("/save", status_code=204)
-async def save_voice(payload: dict) -> Response:
+async def save_voice(payload: dict, request: Request) -> Response:
     """
     Принимает JSON {"text": "<распознанный_текст>"} и добавляет его в voice.txt.
     Между сообщениями остаётся пустая строка.
@@ -16,9 +70,23 @@ async def save_voice(payload: dict) -> Response:
     if not text:
         raise HTTPException(status_code=400, detail="text is empty")
 
-    # .parent.parent => корень проекта рядом с voice.txt
-    with VOICE_FILE.open("a", encoding="utf-8") as f:
-        f.write(text + "\n\n")       # пустая строка-разделитель
+    data = (text + "\n\n").encode("utf-8")       # пустая строка-разделитель
+    state = request.app.state
+
+    # voice.txt открыт один раз в lifespan; запись уходит в поток,
+    # чтобы не блокировать event loop
+    async with _voice_lock:
+        if state.voice_fd < 0:
+            # Прошлая ротация не смогла открыть voice.txt заново
+            state.voice_fd = await asyncio.to_thread(open_voice_file)
+            state.voice_size = _voice_file_size(state.voice_fd)
+        if state.voice_size and state.voice_size + len(data) > VOICE_FILE_MAX_SIZE:
+            state.voice_fd = await asyncio.to_thread(_rotate_voice_file, state.voice_fd)
+            state.voice_size = _voice_file_size(state.voice_fd)
+            if state.voice_fd < 0:
+                raise HTTPException(status_code=500, detail="voice file is unavailable")
+        await asyncio.to_thread(os.write, state.voice_fd, data)
+        state.voice_size += len(data)
 
     # 204 No Content — фронт ничего не ждёт
     return Response(status_code=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 from os.path import join, dirname
@@ -9,9 +10,16 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from aiogram import Bot, Dispatcher
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from tortoise import Tortoise
 
 ROOT_DIR: Path = Path(__file__).resolve().parent.parent
+VOICE_FILE: Path = Path(__file__).resolve().parent / "voice.txt"
+VOICE_FILE_MAX_SIZE: int = 16 * 1024 * 1024  # после 16 МиБ voice.txt уходит в архив
+
+
+def open_voice_file() -> int:
+    return os.open(VOICE_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
 
 
 class Config(BaseSettings):
@@ -42,15 +50,22 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     )
     
     await Tortoise.init(TORTOISE_ORM)
-    yield
-    await Tortoise.close_connections()
-    await bot.session.close()
+    # Один дескриптор в режиме append на всё время работы, а не open/close на запрос
+    app.state.voice_fd = open_voice_file()
+    app.state.voice_size = os.fstat(app.state.voice_fd).st_size
+    try:
+        yield
+    finally:
+        if app.state.voice_fd >= 0:
+            os.close(app.state.voice_fd)
+        await Tortoise.close_connections()
+        await bot.session.close()
 
 config = Config()
 
 bot = Bot(config.BOT_TOKEN.get_secret_value())
 dp = Dispatcher()
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 app.router.lifespan_context = lifespan
 
@@ -1,39 +1,23 @@
 # /utils/telegram_auth.py
 
-import hashlib
-import hmac
 import json
 from typing import Optional
-from urllib.parse import parse_qsl, unquote
+from urllib.parse import unquote
 
 from fastapi import Header, HTTPException
 
-from config_reader import config
 from db.models.user import User
+from utils.tg_signature import verify_init_data
 
 
 def is_valid_init_data(init_data: str) -> Optional[dict]:
     """Проверяет подлинность данных, полученных от Telegram Web App."""
     try:
-        parsed_data = dict(parse_qsl(init_data))
+        parsed_data = verify_init_data(init_data)
     except ValueError:
         return None
 
-    if "hash" not in parsed_data:
-        return None
-
-    init_data_hash = parsed_data.pop("hash")
-    
-    data_check_string = "\n".join(f"{k}={v}" for k, v in sorted(parsed_data.items()))
-    
-    secret_key = hmac.new("WebAppData".encode(), config.BOT_TOKEN.get_secret_value().encode(), hashlib.sha256).digest()
-    calculated_hash = hmac.new(secret_key, data_check_string.encode(), hashlib.sha256).hexdigest()
-
-    if calculated_hash == init_data_hash:
-        user_data = json.loads(unquote(parsed_data.get("user", "{}")))
-        return user_data
-    
-    return None
+    return json.loads(unquote(parsed_data.get("user", "{}")))
 
 async def get_user_from_init_data(x_tg_init_data: str = Header(...)) -> User:
     """
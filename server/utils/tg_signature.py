@@ -0,0 +1,40 @@
+# /utils/tg_signature.py
+
+import hashlib
+import hmac
+from urllib.parse import parse_qsl
+
+from config_reader import config
+
+
+# Ключ зависит только от BOT_TOKEN, поэтому считаем его один раз при импорте.
+# hashlib берёт SHA-256 из OpenSSL (>= 1.1.1 использует SHA-NI, если CPU их поддерживает)
+_SECRET_KEY = hmac.new(b"WebAppData", config.BOT_TOKEN.get_secret_value().encode(), hashlib.sha256).digest()
+
+
+def verify_init_data(init_data: str) -> dict:
+    """
+    Проверка подписи initData по официальной инструкции Telegram:
+    https://core.telegram.org/bots/webapps#validating-data-received-via-the-web-app
+
+    Возвращает поля initData (вместе с hash) или бросает ValueError.
+    """
+    # Один проход по парам: hash откладываем, остальное сортируем по ключу
+    items = []
+    received_hash = ""
+    for key, value in parse_qsl(init_data, strict_parsing=True):
+        if key == "hash":
+            received_hash = value
+        else:
+            items.append((key, value))
+    items.sort()
+
+    data_check_string = "\n".join(f"{k}={v}" for k, v in items)
+    calculated_hash = hmac.new(_SECRET_KEY, data_check_string.encode(), hashlib.sha256).hexdigest()
+
+    if not hmac.compare_digest(calculated_hash, received_hash):
+        raise ValueError("bad signature")
+
+    parsed = dict(items)
+    parsed["hash"] = received_hash
+    return parsed